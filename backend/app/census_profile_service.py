@@ -1,20 +1,37 @@
 from __future__ import annotations
 
 import math
+import threading
 import time
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Callable
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Sequence
 
 import httpx
 
-
-CENSUS_GEOCODER_COORDINATES_URL = (
-    "https://geocoding.geo.census.gov/geocoder/geographies/coordinates"
+from .upstream import (
+    CENSUS_GEOCODER_COORDINATES_URL,
+    CENSUS_REPORTER_BASE_URL,
+    USER_AGENT,
+    RETRYABLE_STATUS_CODES,
+    circuit_open_message,
+    error_body_preview,
+    get_shared_client,
+    json_loads,
+    record_upstream_failure,
+    record_upstream_success,
+    send_with_retries,
 )
-CENSUS_REPORTER_BASE_URL = "https://api.censusreporter.org"
 
-FULL_TRACT_TABLES = [
+_DEFAULT_HEADERS = MappingProxyType({"User-Agent": USER_AGENT})
+
+FULL_TRACT_TABLES = (
     "B01003",
     "B01002",
     "B01001",
@@ -44,12 +61,16 @@ FULL_TRACT_TABLES = [
     "B13016",
     "B21001",
     "B16001",
-]
+)
 
 # Keep comparisons as rich as tract data so frontend can render contextual lines.
-COMPARISON_TABLES = FULL_TRACT_TABLES.copy()
+COMPARISON_TABLES = FULL_TRACT_TABLES
+
+# Query-string form of the bulk table list, joined once instead of on every request.
+_FULL_TRACT_TABLES_JOINED = ",".join(FULL_TRACT_TABLES)
 
-RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Upper bound on concurrent per-table requests when the bulk request falls back.
+FALLBACK_MAX_WORKERS = 8
 
 TRANSPORT_COLUMNS = {
     "drove_alone": "B08301003",
@@ -73,8 +94,27 @@ SELECTOR_LABELS = {
     "county": "County",
 }
 
+# Geocoder responses keyed by (lat, lon) rounded to 5 decimals (~1.1 m). A cell can
+# still straddle a block or tract boundary, and a point in it is then answered with
+# whichever side was looked up first; at this size that only happens within about a
+# metre of a boundary, which is below geocoder precision anyway. Boundaries don't
+# move within a day, so repeat lookups skip the round-trip.
+_GEOCODER_CACHE: OrderedDict[tuple[float, float], tuple[float, dict[str, Any]]] = OrderedDict()
+_GEOCODER_CACHE_TTL = 86400  # seconds
+_GEOCODER_CACHE_MAXSIZE = 4096
+_GEOCODER_CACHE_DECIMALS = 5
+_GEOCODER_CACHE_LOCK = threading.Lock()
+
+# Everything but the "input" block of a lookup, keyed by the geographies the
+# geocoder resolved; points in the same tract/ZCTA/county share one profile.
+_PROFILE_CACHE: OrderedDict[tuple[Any, ...], tuple[float, dict[str, Any]]] = OrderedDict()
+_PROFILE_CACHE_TTL = 86400  # seconds
+_PROFILE_CACHE_MAXSIZE = 1024
+_PROFILE_CACHE_LOCK = threading.Lock()
+
+
 RequestJsonFn = Callable[
-    [httpx.Client, str],
+    [httpx.Client | None, str],
     dict[str, Any],
 ]
 
@@ -97,60 +137,53 @@ class NoTractFoundError(RuntimeError):
     pass
 
 
-def _backoff_seconds(attempt: int) -> float:
-    return min(8.0, 0.5 * (2**attempt))
-
-
-def _short_error_text(text: str, limit: int = 240) -> str:
-    one_line = " ".join(text.split())
-    if len(one_line) <= limit:
-        return one_line
-    return one_line[:limit] + "..."
+def _check_breaker(host: str, stage: str) -> None:
+    circuit_open = circuit_open_message(host)
+    if circuit_open:
+        raise UpstreamAPIError(stage, circuit_open)
 
 
 def request_json(
-    client: httpx.Client,
+    client: httpx.Client | None,
     url: str,
     *,
     params: dict[str, Any] | None,
     stage: str,
     config: ApiConfig,
 ) -> dict[str, Any]:
-    last_error: Exception | None = None
-    headers = {"User-Agent": "groundtruth-census-tools/0.2"}
-    for attempt in range(config.retries + 1):
-        try:
-            response = client.get(url, params=params, timeout=config.timeout, headers=headers)
-        except (httpx.TimeoutException, httpx.TransportError) as exc:
-            last_error = exc
-            if attempt < config.retries:
-                time.sleep(_backoff_seconds(attempt))
-                continue
-            raise UpstreamAPIError(stage, f"Network error after retries: {exc!s}") from exc
-
-        status = response.status_code
-        if status in RETRYABLE_STATUS_CODES:
-            last_error = UpstreamAPIError(
-                stage, f"HTTP {status}: {_short_error_text(response.text)}"
-            )
-            if attempt < config.retries:
-                time.sleep(_backoff_seconds(attempt))
-                continue
-            raise last_error
-
-        if 400 <= status < 500:
-            raise UpstreamAPIError(stage, f"HTTP {status}: {_short_error_text(response.text)}")
-
-        try:
-            return response.json()
-        except ValueError as exc:
-            raise UpstreamAPIError(
-                stage, f"Invalid JSON in upstream response (HTTP {status})"
-            ) from exc
+    client = client or get_shared_client()
+    host = httpx.URL(url).host
+    _check_breaker(host, stage)
+    request = client.build_request(
+        "GET",
+        url,
+        params=params,
+        timeout=config.timeout,
+        headers=_DEFAULT_HEADERS,
+    )
+    try:
+        response = send_with_retries(client, request, config.retries)
+    except httpx.TransportError as exc:
+        record_upstream_failure(host)
+        raise UpstreamAPIError(stage, f"Network error after retries: {exc!s}") from exc
+
+    status = response.status_code
+    if status in RETRYABLE_STATUS_CODES:
+        record_upstream_failure(host)
+        raise UpstreamAPIError(stage, f"HTTP {status}: {error_body_preview(response)}")
+    # A 4xx is a problem with this request (e.g. a table missing from the release),
+    # not upstream degradation, so it neither trips nor resets the breaker.
+    if 400 <= status < 500:
+        raise UpstreamAPIError(stage, f"HTTP {status}: {error_body_preview(response)}")
+    record_upstream_success(host)
 
-    if last_error is not None:
-        raise UpstreamAPIError(stage, f"Failed request after retries: {last_error!s}")
-    raise UpstreamAPIError(stage, "Failed request after retries.")
+    try:
+        # orjson.JSONDecodeError subclasses ValueError, so one handler covers both parsers.
+        return json_loads(response.content)
+    except ValueError as exc:
+        raise UpstreamAPIError(
+            stage, f"Invalid JSON in upstream response (HTTP {status})"
+        ) from exc
 
 
 def extract_first_tract(geocoder_payload: dict[str, Any]) -> dict[str, Any]:
@@ -184,25 +217,29 @@ def extract_optional_zcta(geocoder_payload: dict[str, Any]) -> dict[str, Any] |
     return None
 
 
+@lru_cache(maxsize=256)
 def build_reporter_tract_geoid(tract_fips: str) -> str:
     if len(tract_fips) != 11 or not tract_fips.isdigit():
         raise ValueError(f"Unexpected tract GEOID format: {tract_fips!r}")
     return f"14000US{tract_fips}"
 
 
+@lru_cache(maxsize=256)
 def build_reporter_county_geoid(county_fips: str) -> str:
     if len(county_fips) != 5 or not county_fips.isdigit():
         raise ValueError(f"Unexpected county GEOID format: {county_fips!r}")
     return f"05000US{county_fips}"
 
 
+@lru_cache(maxsize=256)
 def build_reporter_zcta_geoid(zcta: str) -> str:
     if len(zcta) != 5 or not zcta.isdigit():
         raise ValueError(f"Unexpected ZIP/ZCTA format: {zcta!r}")
     return f"86000US{zcta}"
 
 
-def normalize_sumlevel(value: Any) -> str:
+@lru_cache(maxsize=512)
+def normalize_sumlevel(value: str | int | None) -> str:
     text = str(value or "").strip()
     if text.isdigit():
         return text.zfill(3)
@@ -229,10 +266,14 @@ def build_comparison_geoids(
         if not sumlevel:
             continue
         if sumlevel not in by_sumlevel:
-            normalized = dict(parent)
-            normalized["sumlevel"] = sumlevel
-            normalized["geoid"] = geoid
-            by_sumlevel[sumlevel] = normalized
+            # Keep only the fields read downstream; the full parent records are
+            # still returned under parents.available.
+            by_sumlevel[sumlevel] = {
+                "sumlevel": sumlevel,
+                "geoid": geoid,
+                "relation": parent.get("relation"),
+                "display_name": parent.get("display_name"),
+            }
 
     required = dict(required_geoids_by_sumlevel or {})
     required["140"] = tract_geoid
@@ -240,12 +281,13 @@ def build_comparison_geoids(
     for sumlevel, geoid in required.items():
         if not geoid:
             continue
-        record = dict(by_sumlevel.get(sumlevel, {}))
+        record = by_sumlevel.get(sumlevel)
+        if record is None:
+            record = by_sumlevel[sumlevel] = {}
         record["sumlevel"] = sumlevel
         record["geoid"] = geoid
-        if "relation" not in record:
+        if record.get("relation") is None:
             record["relation"] = default_relations.get(sumlevel, "related")
-        by_sumlevel[sumlevel] = record
 
     order = ["140", "860", "050", "160", "310", "040", "010"]
     selected_geoids: list[str] = []
@@ -273,11 +315,17 @@ def build_comparison_geoids(
     return selected_geoids, selected_records
 
 
+def _join_table_ids(table_ids: Sequence[str]) -> str:
+    if table_ids is FULL_TRACT_TABLES:
+        return _FULL_TRACT_TABLES_JOINED
+    return ",".join(table_ids)
+
+
 def fetch_data_show(
-    client: httpx.Client,
+    client: httpx.Client | None,
     *,
     acs: str,
-    table_ids: list[str],
+    table_ids: Sequence[str],
     geoids: list[str],
     stage: str,
     config: ApiConfig,
@@ -286,7 +334,7 @@ def fetch_data_show(
     requester_fn = requester or request_json
     url = f"{CENSUS_REPORTER_BASE_URL}/1.0/data/show/{acs}"
     params = {
-        "table_ids": ",".join(table_ids),
+        "table_ids": _join_table_ids(table_ids),
         "geo_ids": ",".join(geoids),
     }
     return requester_fn(client, url, params=params, stage=stage, config=config)
@@ -322,17 +370,18 @@ def merge_data_show_payload(base: dict[str, Any], incoming: dict[str, Any]) -> N
         base_data = base.setdefault("data", {})
         if isinstance(base_data, dict):
             for geoid, geoid_tables in incoming_data.items():
-                if geoid not in base_data or not isinstance(base_data.get(geoid), dict):
-                    base_data[geoid] = {}
+                target = base_data.get(geoid)
+                if not isinstance(target, dict):
+                    target = base_data[geoid] = {}
                 if isinstance(geoid_tables, dict):
-                    base_data[geoid].update(geoid_tables)
+                    target.update(geoid_tables)
 
 
 def fetch_data_show_resilient(
-    client: httpx.Client,
+    client: httpx.Client | None,
     *,
     acs: str,
-    table_ids: list[str],
+    table_ids: Sequence[str],
     geoids: list[str],
     stage: str,
     config: ApiConfig,
@@ -356,31 +405,40 @@ def fetch_data_show_resilient(
         if marker not in message:
             raise
 
-    merged = new_empty_data_show_payload()
-    errors: list[dict[str, str]] = []
-    successful_tables = 0
-    for table_id in table_ids:
-        table_stage = f"{stage}:{table_id}"
+    def fetch_table(table_id: str) -> dict[str, Any] | UpstreamAPIError:
         try:
-            payload = fetch_data_show(
+            return fetch_data_show(
                 client,
                 acs=acs,
                 table_ids=[table_id],
                 geoids=geoids,
-                stage=table_stage,
+                stage=f"{stage}:{table_id}",
                 config=config,
                 requester=requester_fn,
             )
-            merge_data_show_payload(merged, payload)
-            successful_tables += 1
         except UpstreamAPIError as table_exc:
+            return table_exc
+
+    # Per-table requests are independent, so issue them concurrently and merge
+    # in the original table order once they have all completed.
+    with ThreadPoolExecutor(max_workers=max(1, min(FALLBACK_MAX_WORKERS, len(table_ids)))) as pool:
+        results = list(pool.map(fetch_table, table_ids))
+
+    merged = new_empty_data_show_payload()
+    errors: list[dict[str, str]] = []
+    successful_tables = 0
+    for table_id, result in zip(table_ids, results):
+        if isinstance(result, UpstreamAPIError):
             errors.append(
                 {
                     "stage": stage,
                     "table_id": table_id,
-                    "message": str(table_exc),
+                    "message": str(result),
                 }
             )
+            continue
+        merge_data_show_payload(merged, result)
+        successful_tables += 1
 
     if successful_tables == 0:
         first = errors[0]["message"] if errors else "No fallback requests succeeded."
@@ -400,70 +458,73 @@ def fetch_data_show_resilient(
     return merged, errors
 
 
-def get_estimate(
-    payload: dict[str, Any], geoid: str, table_id: str, column_id: str
-) -> float | int | None:
-    value = (
-        payload.get("data", {})
-        .get(geoid, {})
-        .get(table_id, {})
-        .get("estimate", {})
-        .get(column_id)
-    )
+def _numeric(value: Any) -> float | int | None:
     if isinstance(value, (int, float)):
         return value
     return None
 
 
-def get_moe(
-    payload: dict[str, Any], geoid: str, table_id: str, column_id: str
-) -> float | int | None:
-    value = (
-        payload.get("data", {})
-        .get(geoid, {})
-        .get(table_id, {})
-        .get("error", {})
-        .get(column_id)
-    )
-    if isinstance(value, (int, float)):
-        return value
-    return None
+def _sum_columns(values: Mapping[str, Any], column_ids: Sequence[str]) -> float | None:
+    # map(values.get, ...) does the lookups in C; missing columns come back as None
+    # and are skipped, which itemgetter (KeyError on a miss) cannot do.
+    present = [value for value in map(values.get, column_ids) if isinstance(value, (int, float))]
+    if not present:
+        return None
+    return math.fsum(present)
 
 
-def sum_estimates(
-    payload: dict[str, Any], geoid: str, table_id: str, column_ids: list[str]
-) -> float | None:
-    total = 0.0
-    has_any = False
-    for column_id in column_ids:
-        value = get_estimate(payload, geoid, table_id, column_id)
-        if value is None:
+# (geoid, table_id) -> (estimate columns, error columns), built once per payload so
+# section builders do one dict hit per table instead of re-walking payload["data"].
+FlatPayload = dict[tuple[str, str], tuple[Mapping[str, Any], Mapping[str, Any]]]
+
+_EMPTY_COLUMNS: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_TABLE: tuple[Mapping[str, Any], Mapping[str, Any]] = (_EMPTY_COLUMNS, _EMPTY_COLUMNS)
+
+
+def _flatten_payload(payload: dict[str, Any]) -> FlatPayload:
+    flat: FlatPayload = {}
+    for geoid, tables in payload.get("data", {}).items():
+        if not isinstance(tables, dict):
             continue
-        total += float(value)
-        has_any = True
-    if not has_any:
-        return None
-    return total
+        for table_id, block in tables.items():
+            if isinstance(block, dict):
+                flat[(geoid, table_id)] = (
+                    block.get("estimate", _EMPTY_COLUMNS),
+                    block.get("error", _EMPTY_COLUMNS),
+                )
+    return flat
+
+
+def _geography_names(payload: dict[str, Any]) -> dict[str, str | None]:
+    return {
+        geoid: meta.get("name")
+        for geoid, meta in payload.get("geography", {}).items()
+        if isinstance(meta, dict)
+    }
+
 
+def _get_estimate_flat(
+    flat: FlatPayload, geoid: str, table_id: str, column_id: str
+) -> float | int | None:
+    return _numeric(flat.get((geoid, table_id), _EMPTY_TABLE)[0].get(column_id))
+
+
+def _get_moe_flat(
+    flat: FlatPayload, geoid: str, table_id: str, column_id: str
+) -> float | int | None:
+    return _numeric(flat.get((geoid, table_id), _EMPTY_TABLE)[1].get(column_id))
 
-def sum_moe_rss(
-    payload: dict[str, Any], geoid: str, table_id: str, column_ids: list[str]
+
+def _sum_estimates_flat(
+    flat: FlatPayload, geoid: str, table_id: str, column_ids: Sequence[str]
 ) -> float | None:
-    components: list[float] = []
-    for column_id in column_ids:
-        value = get_moe(payload, geoid, table_id, column_id)
-        if value is None:
-            continue
-        components.append(float(value))
-    if not components:
-        return None
-    return math.sqrt(sum(v * v for v in components))
+    return _sum_columns(flat.get((geoid, table_id), _EMPTY_TABLE)[0], column_ids)
 
 
 def pct(part: float | int | None, whole: float | int | None) -> float | None:
-    if part is None or whole in (None, 0):
+    if part is None or whole is None or whole == 0:
         return None
-    return (float(part) / float(whole)) * 100.0
+    return part / whole * 100.0
 
 
 def _normalize_median(value: float | int | None) -> float | int | None:
@@ -482,6 +543,7 @@ def _table_meta(payload: dict[str, Any], table_id: str) -> dict[str, Any]:
 
 def _metric_block(
     payload: dict[str, Any],
+    flat: FlatPayload,
     geoid: str,
     *,
     metric_id: str,
@@ -494,8 +556,8 @@ def _metric_block(
     universe_override: str | None = None,
     treat_negative_as_null: bool = False,
 ) -> dict[str, Any]:
-    estimate = get_estimate(payload, geoid, table_id, column_id) if value_override is None else value_override
-    moe = get_moe(payload, geoid, table_id, column_id) if moe_override is None else moe_override
+    estimate = _get_estimate_flat(flat, geoid, table_id, column_id) if value_override is None else value_override
+    moe = _get_moe_flat(flat, geoid, table_id, column_id) if moe_override is None else moe_override
     if treat_negative_as_null:
         estimate = _normalize_median(estimate)
     if estimate is not None and isinstance(estimate, float) and estimate.is_integer():
@@ -523,44 +585,44 @@ def _metric_block(
     }
 
 
+def _format_default(numeric: float) -> str:
+    if numeric.is_integer():
+        return f"{int(round(numeric)):,}"
+    return f"{numeric:,.1f}"
+
+
+_COMPARISON_FORMATTERS: dict[str, Callable[[float], str]] = {
+    "currency": lambda numeric: f"${int(round(numeric)):,}",
+    "percent": lambda numeric: f"{numeric:.1f}%",
+    "minutes": lambda numeric: f"{numeric:.1f}",
+}
+
+
 def _format_for_comparison(metric: dict[str, Any], value: float | int | None) -> str:
     if value is None:
         return "N/A"
-
-    fmt = metric.get("format")
-    numeric = float(value)
-
-    if fmt == "currency":
-        return f"${int(round(numeric)):,}"
-    if fmt == "percent":
-        return f"{numeric:.1f}%"
-    if fmt == "minutes":
-        return f"{numeric:.1f}"
-    if float(value).is_integer():
-        return f"{int(round(numeric)):,}"
-    return f"{numeric:,.1f}"
+    formatter = _COMPARISON_FORMATTERS.get(metric.get("format"), _format_default)
+    return formatter(float(value))
+
+
+# Ascending band boundaries; bisect_right picks the phrase whose band contains the ratio.
+_RATIO_THRESHOLDS = (0.15, 0.3, 0.45, 0.6, 0.75, 0.9, 1.2, 1.5, 2.0)
+_RATIO_PHRASES = (
+    "less than 20 percent of",
+    "about one-fifth of",
+    "about one-third of",
+    "about half",
+    "about two-thirds of",
+    "about three-quarters of",
+    "about the same as",
+    "about 20 percent higher than",
+    "about one-and-a-half times",
+    "more than double",
+)
 
 
 def _ratio_phrase(ratio: float) -> str:
-    if ratio >= 2.0:
-        return "more than double"
-    if ratio >= 1.5:
-        return "about one-and-a-half times"
-    if ratio >= 1.2:
-        return "about 20 percent higher than"
-    if ratio >= 0.9:
-        return "about the same as"
-    if ratio >= 0.75:
-        return "about three-quarters of"
-    if ratio >= 0.6:
-        return "about two-thirds of"
-    if ratio >= 0.45:
-        return "about half"
-    if ratio >= 0.3:
-        return "about one-third of"
-    if ratio >= 0.15:
-        return "about one-fifth of"
-    return "less than 20 percent of"
+    return _RATIO_PHRASES[bisect_right(_RATIO_THRESHOLDS, ratio)]
 
 
 def _comparison_lines_for_metric(
@@ -595,14 +657,8 @@ def _comparison_lines_for_metric(
         phrase = _ratio_phrase(ratio)
         place_name = geography_lookup.get(geoid) or geoid
 
-        if phrase in {"more than double", "about one-and-a-half times"}:
-            sentence = f"{phrase} the figure in {place_name}: {_format_for_comparison(metric, compare_value)}"
-        elif phrase == "about the same as":
-            sentence = f"{phrase} the figure in {place_name}: {_format_for_comparison(metric, compare_value)}"
-        elif phrase == "about half":
-            sentence = f"{phrase} the figure in {place_name}: {_format_for_comparison(metric, compare_value)}"
-        else:
-            sentence = f"{phrase} the figure in {place_name}: {_format_for_comparison(metric, compare_value)}"
+        formatted = _format_for_comparison(metric, compare_value)
+        sentence = f"{phrase} the figure in {place_name}: {formatted}"
 
         lines.append(
             {
@@ -620,18 +676,21 @@ def _comparison_lines_for_metric(
 
 
 def _series_from_columns(
-    payload: dict[str, Any],
+    flat: FlatPayload,
     geoid: str,
     *,
     table_id: str,
     total_column_id: str,
-    buckets: list[tuple[str, list[str]]],
+    buckets: Sequence[tuple[str, Sequence[str]]],
 ) -> list[dict[str, Any]]:
-    total = get_estimate(payload, geoid, table_id, total_column_id)
+    estimate = flat.get((geoid, table_id), _EMPTY_TABLE)[0]
+    total = _numeric(estimate.get(total_column_id))
+    # The denominator check is hoisted out of the loop; ``pct`` is inlined per bucket.
+    has_total = total is not None and total != 0
     series: list[dict[str, Any]] = []
     for label, cols in buckets:
-        count = sum_estimates(payload, geoid, table_id, cols)
-        value_pct = pct(count, total)
+        count = _sum_columns(estimate, cols)
+        value_pct = count / total * 100.0 if has_total and count is not None else None
         series.append({
             "label": label,
             "count": count,
@@ -640,52 +699,269 @@ def _series_from_columns(
     return series
 
 
+# Column IDs are materialized once; index 0 is unused so ``_B01001[n]`` maps to
+# column ``B01001{n:03d}``.
+_B01001 = tuple(f"B01001{n:03d}" for n in range(50))
+_B19001 = tuple(f"B19001{n:03d}" for n in range(18))
+_B25075 = tuple(f"B25075{n:03d}" for n in range(28))
+_B15003 = tuple(f"B15003{n:03d}" for n in range(26))
+
+
 def _b01001_col(n: int) -> str:
-    return f"B01001{n:03d}"
+    return _B01001[n]
 
 
 def _b19001_col(n: int) -> str:
-    return f"B19001{n:03d}"
+    return _B19001[n]
 
 
 def _b25075_col(n: int) -> str:
-    return f"B25075{n:03d}"
+    return _B25075[n]
 
 
 def _b15003_col(n: int) -> str:
-    return f"B15003{n:03d}"
+    return _B15003[n]
+
+
+AGE_RANGE_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("0-9", (_B01001[3], _B01001[4], _B01001[27], _B01001[28])),
+    ("10-19", (_B01001[5], _B01001[6], _B01001[7], _B01001[29], _B01001[30], _B01001[31])),
+    ("20-29", (_B01001[8], _B01001[9], _B01001[10], _B01001[11], _B01001[32], _B01001[33], _B01001[34], _B01001[35])),
+    ("30-39", (_B01001[12], _B01001[13], _B01001[36], _B01001[37])),
+    ("40-49", (_B01001[14], _B01001[15], _B01001[38], _B01001[39])),
+    ("50-59", (_B01001[16], _B01001[17], _B01001[40], _B01001[41])),
+    ("60-69", (_B01001[18], _B01001[19], _B01001[20], _B01001[21], _B01001[42], _B01001[43], _B01001[44], _B01001[45])),
+    ("70-79", (_B01001[22], _B01001[23], _B01001[46], _B01001[47])),
+    ("80+", (_B01001[24], _B01001[25], _B01001[48], _B01001[49])),
+)
+
+AGE_CATEGORY_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Under 18", (_B01001[3], _B01001[4], _B01001[5], _B01001[6], _B01001[7], _B01001[27], _B01001[28], _B01001[29], _B01001[30], _B01001[31])),
+    ("18 to 64", (_B01001[8], _B01001[9], _B01001[10], _B01001[11], _B01001[12], _B01001[13], _B01001[14], _B01001[15], _B01001[16], _B01001[17], _B01001[18], _B01001[19], _B01001[42], _B01001[43], _B01001[32], _B01001[33], _B01001[34], _B01001[35], _B01001[36], _B01001[37], _B01001[38], _B01001[39], _B01001[40], _B01001[41])),
+    ("65 and over", (_B01001[20], _B01001[21], _B01001[22], _B01001[23], _B01001[24], _B01001[25], _B01001[44], _B01001[45], _B01001[46], _B01001[47], _B01001[48], _B01001[49])),
+)
+
+RACE_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("White", ("B03002003",)),
+    ("Black", ("B03002004",)),
+    ("Native", ("B03002005",)),
+    ("Asian", ("B03002006",)),
+    ("Islander", ("B03002007",)),
+    ("Other", ("B03002008",)),
+    ("Two+", ("B03002009",)),
+    ("Hispanic", ("B03002012",)),
+)
+
+INCOME_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Under $50K", _B19001[2:11]),
+    ("$50K - $100K", _B19001[11:14]),
+    ("$100K - $200K", _B19001[14:17]),
+    ("Over $200K", (_B19001[17],)),
+)
+
+TRANSPORT_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Drove alone", (TRANSPORT_COLUMNS["drove_alone"],)),
+    ("Carpooled", (TRANSPORT_COLUMNS["carpooled"],)),
+    ("Public transit", (TRANSPORT_COLUMNS["public_transit"],)),
+    ("Bicycle", (TRANSPORT_COLUMNS["bicycle"],)),
+    ("Walked", (TRANSPORT_COLUMNS["walked"],)),
+    ("Other", (TRANSPORT_COLUMNS["other"],)),
+    ("Worked at home", (TRANSPORT_COLUMNS["worked_from_home"],)),
+)
+
+HOME_VALUE_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Under $100K", _B25075[2:13]),
+    ("$100K - $200K", _B25075[13:17]),
+    ("$200K - $300K", _B25075[17:19]),
+    ("$300K - $400K", (_B25075[19],)),
+    ("$400K - $500K", (_B25075[20],)),
+    ("$500K - $1M", (_B25075[21], _B25075[22])),
+    ("Over $1M", (_B25075[23], _B25075[24], _B25075[25])),
+)
+
+EDUCATION_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("No degree", _B15003[2:17]),
+    ("High school", (_B15003[17], _B15003[18])),
+    ("Some college", (_B15003[19], _B15003[20], _B15003[21])),
+    ("Bachelor's", (_B15003[22],)),
+    ("Post-grad", (_B15003[23], _B15003[24], _B15003[25])),
+)
+
+HOUSEHOLD_TYPE_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Married couples", ("B11001003",)),
+    ("Male householder", ("B11001004",)),
+    ("Female householder", ("B11001005",)),
+    ("Non-family", ("B11001006",)),
+)
+
+MARITAL_STATUS_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Never married Male", ("B12001003",)),
+    ("Never married Female", ("B12001009",)),
+    ("Now married Male", ("B12001004",)),
+    ("Now married Female", ("B12001010",)),
+    ("Divorced Male", ("B12001007",)),
+    ("Divorced Female", ("B12001013",)),
+    ("Widowed Male", ("B12001006",)),
+    ("Widowed Female", ("B12001012",)),
+)
+
+FERTILITY_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("15-19", ("B13016004",)),
+    ("20-24", ("B13016006",)),
+    ("25-29", ("B13016008",)),
+    ("30-35", ("B13016010",)),
+    ("35-39", ("B13016012",)),
+    ("40-44", ("B13016014",)),
+    ("45-50", ("B13016016",)),
+)
+
+OCCUPANCY_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Occupied", ("B25002002",)),
+    ("Vacant", ("B25002003",)),
+)
+
+TENURE_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Owner occupied", ("B25003002",)),
+    ("Renter occupied", ("B25003003",)),
+)
+
+STRUCTURE_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Single unit", ("B25024002", "B25024003")),
+    ("Multi-unit", ("B25024004", "B25024005", "B25024006", "B25024007", "B25024008", "B25024009")),
+    ("Mobile home", ("B25024010",)),
+    ("Boat, RV, van", ("B25024011",)),
+)
+
+BIRTH_REGION_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Europe", ("B05006002",)),
+    ("Asia", ("B05006020",)),
+    ("Africa", ("B05006031",)),
+    ("Oceania", ("B05006040",)),
+    ("Latin America", ("B05006045",)),
+    ("Northern America", ("B05006047",)),
+)
+
+MIGRATION_BUCKETS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Same house year ago", ("B07003002",)),
+    ("From same county", ("B07003004",)),
+    ("From different county", ("B07003005",)),
+    ("From different state", ("B07003006",)),
+    ("From abroad", ("B07003007",)),
+)
 
 
 def _safe_float(value: Any) -> float | None:
-    if isinstance(value, (int, float)):
+    # Exact type checks cover the common JSON number cases without entering try/except.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
         return float(value)
+    if value is None:
+        return None
     try:
-        parsed = float(value)
+        return float(value)
     except (TypeError, ValueError):
         return None
-    return parsed
 
 
-def _build_demographics_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+# Metrics read straight from a single column; derived shares are built inline.
+_DEMOGRAPHICS_METRIC_SPECS: tuple[dict[str, Any], ...] = (
+    {
+        "metric_id": "median_age",
+        "label": "Median age",
+        "table_id": "B01002",
+        "column_id": "B01002001",
+        "format_hint": "number",
+    },
+)
+
+_ECONOMICS_METRIC_SPECS: tuple[dict[str, Any], ...] = (
+    {
+        "metric_id": "per_capita_income",
+        "label": "Per capita income",
+        "table_id": "B19301",
+        "column_id": "B19301001",
+        "format_hint": "currency",
+        "treat_negative_as_null": True,
+    },
+    {
+        "metric_id": "median_household_income",
+        "label": "Median household income",
+        "table_id": "B19013",
+        "column_id": "B19013001",
+        "format_hint": "currency",
+        "treat_negative_as_null": True,
+    },
+    {
+        "metric_id": "mean_travel_time",
+        "label": "Mean travel time to work",
+        "table_id": "B08303",
+        "column_id": "B08303001",
+        "format_hint": "minutes",
+    },
+)
+
+_FAMILIES_METRIC_SPECS: tuple[dict[str, Any], ...] = (
+    {
+        "metric_id": "households",
+        "label": "Number of households",
+        "table_id": "B11001",
+        "column_id": "B11001001",
+        "format_hint": "number",
+    },
+    {
+        "metric_id": "persons_per_household",
+        "label": "Persons per household",
+        "table_id": "B25010",
+        "column_id": "B25010001",
+        "format_hint": "number",
+    },
+)
+
+_HOUSING_METRIC_SPECS: tuple[dict[str, Any], ...] = (
+    {
+        "metric_id": "housing_units",
+        "label": "Number of housing units",
+        "table_id": "B25001",
+        "column_id": "B25001001",
+        "format_hint": "number",
+    },
+    {
+        "metric_id": "median_home_value",
+        "label": "Median value of owner-occupied housing units",
+        "table_id": "B25077",
+        "column_id": "B25077001",
+        "format_hint": "currency",
+        "treat_negative_as_null": True,
+    },
+    {
+        "metric_id": "median_rent",
+        "label": "Median gross rent",
+        "table_id": "B25064",
+        "column_id": "B25064001",
+        "format_hint": "currency",
+        "treat_negative_as_null": True,
+    },
+)
+
+
+def _build_demographics_section(
+    payload: dict[str, Any], flat: FlatPayload, geoid: str
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
     metrics: dict[str, dict[str, Any]] = {}
 
-    metrics["median_age"] = _metric_block(
-        payload,
-        geoid,
-        metric_id="median_age",
-        label="Median age",
-        table_id="B01002",
-        column_id="B01002001",
-        format_hint="number",
-    )
+    for spec in _DEMOGRAPHICS_METRIC_SPECS:
+        metrics[spec["metric_id"]] = _metric_block(payload, flat, geoid, **spec)
 
-    male_count = get_estimate(payload, geoid, "B01001", _b01001_col(2))
-    female_count = get_estimate(payload, geoid, "B01001", _b01001_col(26))
-    total_population = get_estimate(payload, geoid, "B01001", _b01001_col(1))
+    male_count = _get_estimate_flat(flat, geoid, "B01001", _b01001_col(2))
+    female_count = _get_estimate_flat(flat, geoid, "B01001", _b01001_col(26))
+    total_population = _get_estimate_flat(flat, geoid, "B01001", _b01001_col(1))
     male_pct = pct(male_count, total_population)
     female_pct = pct(female_count, total_population)
     metrics["male_share"] = _metric_block(
         payload,
+        flat,
         geoid,
         metric_id="male_share",
         label="Male",
@@ -697,6 +973,7 @@ def _build_demographics_section(payload: dict[str, Any], geoid: str) -> tuple[di
     )
     metrics["female_share"] = _metric_block(
         payload,
+        flat,
         geoid,
         metric_id="female_share",
         label="Female",
@@ -707,45 +984,17 @@ def _build_demographics_section(payload: dict[str, Any], geoid: str) -> tuple[di
         universe_override="Total population",
     )
 
-    age_range_buckets = [
-        ("0-9", [_b01001_col(3), _b01001_col(4), _b01001_col(27), _b01001_col(28)]),
-        ("10-19", [_b01001_col(5), _b01001_col(6), _b01001_col(7), _b01001_col(29), _b01001_col(30), _b01001_col(31)]),
-        ("20-29", [_b01001_col(8), _b01001_col(9), _b01001_col(10), _b01001_col(11), _b01001_col(32), _b01001_col(33), _b01001_col(34), _b01001_col(35)]),
-        ("30-39", [_b01001_col(12), _b01001_col(13), _b01001_col(36), _b01001_col(37)]),
-        ("40-49", [_b01001_col(14), _b01001_col(15), _b01001_col(38), _b01001_col(39)]),
-        ("50-59", [_b01001_col(16), _b01001_col(17), _b01001_col(40), _b01001_col(41)]),
-        ("60-69", [_b01001_col(18), _b01001_col(19), _b01001_col(20), _b01001_col(21), _b01001_col(42), _b01001_col(43), _b01001_col(44), _b01001_col(45)]),
-        ("70-79", [_b01001_col(22), _b01001_col(23), _b01001_col(46), _b01001_col(47)]),
-        ("80+", [_b01001_col(24), _b01001_col(25), _b01001_col(48), _b01001_col(49)]),
-    ]
-    age_category_buckets = [
-        ("Under 18", [_b01001_col(3), _b01001_col(4), _b01001_col(5), _b01001_col(6), _b01001_col(7), _b01001_col(27), _b01001_col(28), _b01001_col(29), _b01001_col(30), _b01001_col(31)]),
-        ("18 to 64", [_b01001_col(8), _b01001_col(9), _b01001_col(10), _b01001_col(11), _b01001_col(12), _b01001_col(13), _b01001_col(14), _b01001_col(15), _b01001_col(16), _b01001_col(17), _b01001_col(18), _b01001_col(19), _b01001_col(42), _b01001_col(43), _b01001_col(32), _b01001_col(33), _b01001_col(34), _b01001_col(35), _b01001_col(36), _b01001_col(37), _b01001_col(38), _b01001_col(39), _b01001_col(40), _b01001_col(41)]),
-        ("65 and over", [_b01001_col(20), _b01001_col(21), _b01001_col(22), _b01001_col(23), _b01001_col(24), _b01001_col(25), _b01001_col(44), _b01001_col(45), _b01001_col(46), _b01001_col(47), _b01001_col(48), _b01001_col(49)]),
-    ]
-
-    race_buckets = [
-        ("White", ["B03002003"]),
-        ("Black", ["B03002004"]),
-        ("Native", ["B03002005"]),
-        ("Asian", ["B03002006"]),
-        ("Islander", ["B03002007"]),
-        ("Other", ["B03002008"]),
-        ("Two+", ["B03002009"]),
-        ("Hispanic", ["B03002012"]),
-    ]
-
     charts = [
         {
             "id": "age_ranges",
             "label": "Population by age range",
             "type": "bar",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B01001",
                 total_column_id="B01001001",
-                buckets=age_range_buckets,
+                buckets=AGE_RANGE_BUCKETS,
             ),
             "universe": "Total population",
         },
@@ -754,11 +1003,11 @@ def _build_demographics_section(payload: dict[str, Any], geoid: str) -> tuple[di
             "label": "Population by age category",
             "type": "donut",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B01001",
                 total_column_id="B01001001",
-                buckets=age_category_buckets,
+                buckets=AGE_CATEGORY_BUCKETS,
             ),
             "universe": "Total population",
         },
@@ -777,11 +1026,11 @@ def _build_demographics_section(payload: dict[str, Any], geoid: str) -> tuple[di
             "label": "Race & Ethnicity",
             "type": "bar",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B03002",
                 total_column_id="B03002001",
-                buckets=race_buckets,
+                buckets=RACE_BUCKETS,
             ),
             "universe": "Total population",
             "note": "Hispanic includes respondents of any race. Other categories are non-Hispanic.",
@@ -797,35 +1046,20 @@ def _build_demographics_section(payload: dict[str, Any], geoid: str) -> tuple[di
     return section, metrics
 
 
-def _build_economics_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+def _build_economics_section(
+    payload: dict[str, Any], flat: FlatPayload, geoid: str
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
     metrics: dict[str, dict[str, Any]] = {}
 
-    metrics["per_capita_income"] = _metric_block(
-        payload,
-        geoid,
-        metric_id="per_capita_income",
-        label="Per capita income",
-        table_id="B19301",
-        column_id="B19301001",
-        format_hint="currency",
-        treat_negative_as_null=True,
-    )
-    metrics["median_household_income"] = _metric_block(
-        payload,
-        geoid,
-        metric_id="median_household_income",
-        label="Median household income",
-        table_id="B19013",
-        column_id="B19013001",
-        format_hint="currency",
-        treat_negative_as_null=True,
-    )
+    for spec in _ECONOMICS_METRIC_SPECS:
+        metrics[spec["metric_id"]] = _metric_block(payload, flat, geoid, **spec)
 
-    poverty_total = get_estimate(payload, geoid, "B17001", "B17001001")
-    poverty_below = get_estimate(payload, geoid, "B17001", "B17001002")
+    poverty_total = _get_estimate_flat(flat, geoid, "B17001", "B17001001")
+    poverty_below = _get_estimate_flat(flat, geoid, "B17001", "B17001002")
     poverty_rate = pct(poverty_below, poverty_total)
     metrics["poverty_rate"] = _metric_block(
         payload,
+        flat,
         geoid,
         metric_id="poverty_rate",
         label="Persons below poverty line",
@@ -836,44 +1070,17 @@ def _build_economics_section(payload: dict[str, Any], geoid: str) -> tuple[dict[
         universe_override="Population for whom poverty status is determined",
     )
 
-    metrics["mean_travel_time"] = _metric_block(
-        payload,
-        geoid,
-        metric_id="mean_travel_time",
-        label="Mean travel time to work",
-        table_id="B08303",
-        column_id="B08303001",
-        format_hint="minutes",
-    )
-
-    income_buckets = [
-        ("Under $50K", [_b19001_col(i) for i in range(2, 11)]),
-        ("$50K - $100K", [_b19001_col(i) for i in range(11, 14)]),
-        ("$100K - $200K", [_b19001_col(i) for i in range(14, 17)]),
-        ("Over $200K", [_b19001_col(17)]),
-    ]
-
-    transport_series = [
-        ("Drove alone", [TRANSPORT_COLUMNS["drove_alone"]]),
-        ("Carpooled", [TRANSPORT_COLUMNS["carpooled"]]),
-        ("Public transit", [TRANSPORT_COLUMNS["public_transit"]]),
-        ("Bicycle", [TRANSPORT_COLUMNS["bicycle"]]),
-        ("Walked", [TRANSPORT_COLUMNS["walked"]]),
-        ("Other", [TRANSPORT_COLUMNS["other"]]),
-        ("Worked at home", [TRANSPORT_COLUMNS["worked_from_home"]]),
-    ]
-
     charts = [
         {
             "id": "household_income_distribution",
             "label": "Household income",
             "type": "bar",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B19001",
                 total_column_id="B19001001",
-                buckets=income_buckets,
+                buckets=INCOME_BUCKETS,
             ),
             "universe": "Households",
         },
@@ -882,11 +1089,11 @@ def _build_economics_section(payload: dict[str, Any], geoid: str) -> tuple[dict[
             "label": "Means of transportation to work",
             "type": "bar",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B08301",
                 total_column_id="B08301001",
-                buckets=transport_series,
+                buckets=TRANSPORT_BUCKETS,
             ),
             "universe": "Workers 16 years and over",
         },
@@ -906,33 +1113,20 @@ def _build_economics_section(payload: dict[str, Any], geoid: str) -> tuple[dict[
     return section, metrics
 
 
-def _build_families_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+def _build_families_section(
+    payload: dict[str, Any], flat: FlatPayload, geoid: str
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
     metrics: dict[str, dict[str, Any]] = {}
 
-    metrics["households"] = _metric_block(
-        payload,
-        geoid,
-        metric_id="households",
-        label="Number of households",
-        table_id="B11001",
-        column_id="B11001001",
-        format_hint="number",
-    )
-    metrics["persons_per_household"] = _metric_block(
-        payload,
-        geoid,
-        metric_id="persons_per_household",
-        label="Persons per household",
-        table_id="B25010",
-        column_id="B25010001",
-        format_hint="number",
-    )
+    for spec in _FAMILIES_METRIC_SPECS:
+        metrics[spec["metric_id"]] = _metric_block(payload, flat, geoid, **spec)
 
-    marital_total = get_estimate(payload, geoid, "B12001", "B12001001")
-    married_count = sum_estimates(payload, geoid, "B12001", ["B12001004", "B12001010"])
+    marital_total = _get_estimate_flat(flat, geoid, "B12001", "B12001001")
+    married_count = _sum_estimates_flat(flat, geoid, "B12001", ["B12001004", "B12001010"])
     married_share = pct(married_count, marital_total)
     metrics["married_share"] = _metric_block(
         payload,
+        flat,
         geoid,
         metric_id="married_share",
         label="Married",
@@ -943,11 +1137,12 @@ def _build_families_section(payload: dict[str, Any], geoid: str) -> tuple[dict[s
         universe_override="Population 15 years and over",
     )
 
-    fertility_total = get_estimate(payload, geoid, "B13016", "B13016001")
-    fertility_birth = get_estimate(payload, geoid, "B13016", "B13016002")
+    fertility_total = _get_estimate_flat(flat, geoid, "B13016", "B13016001")
+    fertility_birth = _get_estimate_flat(flat, geoid, "B13016", "B13016002")
     fertility_rate = pct(fertility_birth, fertility_total)
     metrics["fertility_rate"] = _metric_block(
         payload,
+        flat,
         geoid,
         metric_id="fertility_rate",
         label="Women 15-50 who gave birth during past year",
@@ -958,45 +1153,17 @@ def _build_families_section(payload: dict[str, Any], geoid: str) -> tuple[dict[s
         universe_override="Women 15 to 50 years",
     )
 
-    household_type_buckets = [
-        ("Married couples", ["B11001003"]),
-        ("Male householder", ["B11001004"]),
-        ("Female householder", ["B11001005"]),
-        ("Non-family", ["B11001006"]),
-    ]
-
-    marital_buckets = [
-        ("Never married Male", ["B12001003"]),
-        ("Never married Female", ["B12001009"]),
-        ("Now married Male", ["B12001004"]),
-        ("Now married Female", ["B12001010"]),
-        ("Divorced Male", ["B12001007"]),
-        ("Divorced Female", ["B12001013"]),
-        ("Widowed Male", ["B12001006"]),
-        ("Widowed Female", ["B12001012"]),
-    ]
-
-    fertility_buckets = [
-        ("15-19", ["B13016004"]),
-        ("20-24", ["B13016006"]),
-        ("25-29", ["B13016008"]),
-        ("30-35", ["B13016010"]),
-        ("35-39", ["B13016012"]),
-        ("40-44", ["B13016014"]),
-        ("45-50", ["B13016016"]),
-    ]
-
     charts = [
         {
             "id": "household_type",
             "label": "Population by household type",
             "type": "bar",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B11001",
                 total_column_id="B11001001",
-                buckets=household_type_buckets,
+                buckets=HOUSEHOLD_TYPE_BUCKETS,
             ),
             "universe": "Households",
         },
@@ -1005,11 +1172,11 @@ def _build_families_section(payload: dict[str, Any], geoid: str) -> tuple[dict[s
             "label": "Marital status, by sex",
             "type": "bar",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B12001",
                 total_column_id="B12001001",
-                buckets=marital_buckets,
+                buckets=MARITAL_STATUS_BUCKETS,
             ),
             "universe": "Population 15 years and over",
         },
@@ -1018,11 +1185,11 @@ def _build_families_section(payload: dict[str, Any], geoid: str) -> tuple[dict[s
             "label": "Women who gave birth during past year, by age group",
             "type": "bar",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B13016",
                 total_column_id="B13016001",
-                buckets=fertility_buckets,
+                buckets=FERTILITY_BUCKETS,
             ),
             "universe": "Women 15 to 50 years",
         },
@@ -1042,63 +1209,13 @@ def _build_families_section(payload: dict[str, Any], geoid: str) -> tuple[dict[s
     return section, metrics
 
 
-def _build_housing_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+def _build_housing_section(
+    payload: dict[str, Any], flat: FlatPayload, geoid: str
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
     metrics: dict[str, dict[str, Any]] = {}
 
-    metrics["housing_units"] = _metric_block(
-        payload,
-        geoid,
-        metric_id="housing_units",
-        label="Number of housing units",
-        table_id="B25001",
-        column_id="B25001001",
-        format_hint="number",
-    )
-    metrics["median_home_value"] = _metric_block(
-        payload,
-        geoid,
-        metric_id="median_home_value",
-        label="Median value of owner-occupied housing units",
-        table_id="B25077",
-        column_id="B25077001",
-        format_hint="currency",
-        treat_negative_as_null=True,
-    )
-    metrics["median_rent"] = _metric_block(
-        payload,
-        geoid,
-        metric_id="median_rent",
-        label="Median gross rent",
-        table_id="B25064",
-        column_id="B25064001",
-        format_hint="currency",
-        treat_negative_as_null=True,
-    )
-
-    occupancy_buckets = [
-        ("Occupied", ["B25002002"]),
-        ("Vacant", ["B25002003"]),
-    ]
-    tenure_buckets = [
-        ("Owner occupied", ["B25003002"]),
-        ("Renter occupied", ["B25003003"]),
-    ]
-    structure_buckets = [
-        ("Single unit", ["B25024002", "B25024003"]),
-        ("Multi-unit", ["B25024004", "B25024005", "B25024006", "B25024007", "B25024008", "B25024009"]),
-        ("Mobile home", ["B25024010"]),
-        ("Boat, RV, van", ["B25024011"]),
-    ]
-
-    value_bins = [
-        ("Under $100K", [_b25075_col(i) for i in range(2, 13)]),
-        ("$100K - $200K", [_b25075_col(i) for i in range(13, 17)]),
-        ("$200K - $300K", [_b25075_col(i) for i in range(17, 19)]),
-        ("$300K - $400K", [_b25075_col(19)]),
-        ("$400K - $500K", [_b25075_col(20)]),
-        ("$500K - $1M", [_b25075_col(21), _b25075_col(22)]),
-        ("Over $1M", [_b25075_col(23), _b25075_col(24), _b25075_col(25)]),
-    ]
+    for spec in _HOUSING_METRIC_SPECS:
+        metrics[spec["metric_id"]] = _metric_block(payload, flat, geoid, **spec)
 
     charts = [
         {
@@ -1106,11 +1223,11 @@ def _build_housing_section(payload: dict[str, Any], geoid: str) -> tuple[dict[st
             "label": "Occupied vs. Vacant",
             "type": "donut",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B25002",
                 total_column_id="B25002001",
-                buckets=occupancy_buckets,
+                buckets=OCCUPANCY_BUCKETS,
             ),
             "universe": "Housing units",
         },
@@ -1119,11 +1236,11 @@ def _build_housing_section(payload: dict[str, Any], geoid: str) -> tuple[dict[st
             "label": "Ownership of occupied units",
             "type": "donut",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B25003",
                 total_column_id="B25003001",
-                buckets=tenure_buckets,
+                buckets=TENURE_BUCKETS,
             ),
             "universe": "Occupied housing units",
         },
@@ -1132,11 +1249,11 @@ def _build_housing_section(payload: dict[str, Any], geoid: str) -> tuple[dict[st
             "label": "Types of structure",
             "type": "bar",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B25024",
                 total_column_id="B25024001",
-                buckets=structure_buckets,
+                buckets=STRUCTURE_BUCKETS,
             ),
             "universe": "Housing units",
         },
@@ -1145,11 +1262,11 @@ def _build_housing_section(payload: dict[str, Any], geoid: str) -> tuple[dict[st
             "label": "Value of owner-occupied housing units",
             "type": "bar",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B25075",
                 total_column_id="B25075001",
-                buckets=value_bins,
+                buckets=HOME_VALUE_BUCKETS,
             ),
             "universe": "Owner-occupied housing units",
         },
@@ -1168,15 +1285,18 @@ def _build_housing_section(payload: dict[str, Any], geoid: str) -> tuple[dict[st
     return section, metrics
 
 
-def _build_social_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+def _build_social_section(
+    payload: dict[str, Any], flat: FlatPayload, geoid: str
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
     metrics: dict[str, dict[str, Any]] = {}
 
-    education_total = get_estimate(payload, geoid, "B15003", "B15003001")
-    hs_plus = sum_estimates(payload, geoid, "B15003", B15003_HIGH_SCHOOL_PLUS)
-    bachelors_plus = sum_estimates(payload, geoid, "B15003", B15003_BACHELORS_PLUS)
+    education_total = _get_estimate_flat(flat, geoid, "B15003", "B15003001")
+    hs_plus = _sum_estimates_flat(flat, geoid, "B15003", B15003_HIGH_SCHOOL_PLUS)
+    bachelors_plus = _sum_estimates_flat(flat, geoid, "B15003", B15003_BACHELORS_PLUS)
 
     metrics["hs_or_higher_pct"] = _metric_block(
         payload,
+        flat,
         geoid,
         metric_id="hs_or_higher_pct",
         label="High school grad or higher",
@@ -1188,6 +1308,7 @@ def _build_social_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str
     )
     metrics["bachelors_or_higher_pct"] = _metric_block(
         payload,
+        flat,
         geoid,
         metric_id="bachelors_or_higher_pct",
         label="Bachelor's degree or higher",
@@ -1198,10 +1319,11 @@ def _build_social_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str
         universe_override="Population 25 years and over",
     )
 
-    foreign_total = get_estimate(payload, geoid, "B05002", "B05002001")
-    foreign_born = get_estimate(payload, geoid, "B05002", "B05002013")
+    foreign_total = _get_estimate_flat(flat, geoid, "B05002", "B05002001")
+    foreign_born = _get_estimate_flat(flat, geoid, "B05002", "B05002013")
     metrics["foreign_born_pct"] = _metric_block(
         payload,
+        flat,
         geoid,
         metric_id="foreign_born_pct",
         label="Foreign-born population",
@@ -1212,10 +1334,11 @@ def _build_social_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str
         universe_override="Total population",
     )
 
-    veteran_total = get_estimate(payload, geoid, "B21001", "B21001001")
-    veteran_count = get_estimate(payload, geoid, "B21001", "B21001002")
+    veteran_total = _get_estimate_flat(flat, geoid, "B21001", "B21001001")
+    veteran_count = _get_estimate_flat(flat, geoid, "B21001", "B21001002")
     metrics["veteran_pct"] = _metric_block(
         payload,
+        flat,
         geoid,
         metric_id="veteran_pct",
         label="Population with veteran status",
@@ -1226,14 +1349,15 @@ def _build_social_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str
         universe_override="Civilian population 18 years and over",
     )
 
-    language_total = get_estimate(payload, geoid, "B16001", "B16001001")
-    english_only = get_estimate(payload, geoid, "B16001", "B16001002")
+    language_total = _get_estimate_flat(flat, geoid, "B16001", "B16001001")
+    english_only = _get_estimate_flat(flat, geoid, "B16001", "B16001002")
     other_language = None
     if isinstance(language_total, (int, float)) and isinstance(english_only, (int, float)):
         other_language = language_total - english_only
 
     metrics["language_other_than_english_pct"] = _metric_block(
         payload,
+        flat,
         geoid,
         metric_id="language_other_than_english_pct",
         label="Persons with language other than English spoken at home",
@@ -1244,10 +1368,11 @@ def _build_social_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str
         universe_override="Population 5 years and over",
     )
 
-    mobility_total = get_estimate(payload, geoid, "B07003", "B07003001")
-    moved = sum_estimates(payload, geoid, "B07003", ["B07003004", "B07003005", "B07003006", "B07003007"])
+    mobility_total = _get_estimate_flat(flat, geoid, "B07003", "B07003001")
+    moved = _sum_estimates_flat(flat, geoid, "B07003", ["B07003004", "B07003005", "B07003006", "B07003007"])
     metrics["moved_last_year_pct"] = _metric_block(
         payload,
+        flat,
         geoid,
         metric_id="moved_last_year_pct",
         label="Moved since previous year",
@@ -1258,42 +1383,17 @@ def _build_social_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str
         universe_override="Population 1 year and over",
     )
 
-    education_buckets = [
-        ("No degree", [_b15003_col(i) for i in range(2, 17)]),
-        ("High school", [_b15003_col(17), _b15003_col(18)]),
-        ("Some college", [_b15003_col(19), _b15003_col(20), _b15003_col(21)]),
-        ("Bachelor's", [_b15003_col(22)]),
-        ("Post-grad", [_b15003_col(23), _b15003_col(24), _b15003_col(25)]),
-    ]
-
-    birth_region_buckets = [
-        ("Europe", ["B05006002"]),
-        ("Asia", ["B05006020"]),
-        ("Africa", ["B05006031"]),
-        ("Oceania", ["B05006040"]),
-        ("Latin America", ["B05006045"]),
-        ("Northern America", ["B05006047"]),
-    ]
-
-    migration_buckets = [
-        ("Same house year ago", ["B07003002"]),
-        ("From same county", ["B07003004"]),
-        ("From different county", ["B07003005"]),
-        ("From different state", ["B07003006"]),
-        ("From abroad", ["B07003007"]),
-    ]
-
     charts = [
         {
             "id": "education_distribution",
             "label": "Population by highest level of education",
             "type": "bar",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B15003",
                 total_column_id="B15003001",
-                buckets=education_buckets,
+                buckets=EDUCATION_BUCKETS,
             ),
             "universe": "Population 25 years and over",
         },
@@ -1302,11 +1402,11 @@ def _build_social_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str
             "label": "Place of birth for foreign-born population",
             "type": "bar",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B05006",
                 total_column_id="B05006001",
-                buckets=birth_region_buckets,
+                buckets=BIRTH_REGION_BUCKETS,
             ),
             "universe": "Foreign-born population",
         },
@@ -1315,11 +1415,11 @@ def _build_social_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str
             "label": "Population migration since previous year",
             "type": "bar",
             "series": _series_from_columns(
-                payload,
+                flat,
                 geoid,
                 table_id="B07003",
                 total_column_id="B07003001",
-                buckets=migration_buckets,
+                buckets=MIGRATION_BUCKETS,
             ),
             "universe": "Population 1 year and over",
         },
@@ -1342,13 +1442,16 @@ def _build_social_section(payload: dict[str, Any], geoid: str) -> tuple[dict[str
 
 
 def _build_sections_for_geoid(
-    payload: dict[str, Any], geoid: str
+    payload: dict[str, Any], geoid: str, flat: FlatPayload | None = None
 ) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]:
+    if flat is None:
+        flat = _flatten_payload(payload)
     sections: list[dict[str, Any]] = []
     metric_map: dict[str, dict[str, Any]] = {}
 
     metric_map["population"] = _metric_block(
         payload,
+        flat,
         geoid,
         metric_id="population",
         label="Population",
@@ -1357,11 +1460,11 @@ def _build_sections_for_geoid(
         format_hint="number",
     )
 
-    demographics_section, demographics_metrics = _build_demographics_section(payload, geoid)
-    economics_section, economics_metrics = _build_economics_section(payload, geoid)
-    families_section, families_metrics = _build_families_section(payload, geoid)
-    housing_section, housing_metrics = _build_housing_section(payload, geoid)
-    social_section, social_metrics = _build_social_section(payload, geoid)
+    demographics_section, demographics_metrics = _build_demographics_section(payload, flat, geoid)
+    economics_section, economics_metrics = _build_economics_section(payload, flat, geoid)
+    families_section, families_metrics = _build_families_section(payload, flat, geoid)
+    housing_section, housing_metrics = _build_housing_section(payload, flat, geoid)
+    social_section, social_metrics = _build_social_section(payload, flat, geoid)
 
     sections.extend(
         [
@@ -1463,32 +1566,34 @@ def _build_geography_profile_summary(
 
 
 def compute_highlights_for_geoid(
-    payload: dict[str, Any], geoid: str, name: str | None
+    payload: dict[str, Any], geoid: str, name: str | None, flat: FlatPayload | None = None
 ) -> dict[str, Any]:
-    population = get_estimate(payload, geoid, "B01003", "B01003001")
-    median_age = get_estimate(payload, geoid, "B01002", "B01002001")
-    median_household_income = _normalize_median(get_estimate(payload, geoid, "B19013", "B19013001"))
-    per_capita_income = _normalize_median(get_estimate(payload, geoid, "B19301", "B19301001"))
-
-    poverty_total = get_estimate(payload, geoid, "B17001", "B17001001")
-    poverty_below = get_estimate(payload, geoid, "B17001", "B17001002")
+    if flat is None:
+        flat = _flatten_payload(payload)
+    population = _get_estimate_flat(flat, geoid, "B01003", "B01003001")
+    median_age = _get_estimate_flat(flat, geoid, "B01002", "B01002001")
+    median_household_income = _normalize_median(_get_estimate_flat(flat, geoid, "B19013", "B19013001"))
+    per_capita_income = _normalize_median(_get_estimate_flat(flat, geoid, "B19301", "B19301001"))
+
+    poverty_total = _get_estimate_flat(flat, geoid, "B17001", "B17001001")
+    poverty_below = _get_estimate_flat(flat, geoid, "B17001", "B17001002")
     poverty_rate = pct(poverty_below, poverty_total)
 
-    median_rent = _normalize_median(get_estimate(payload, geoid, "B25064", "B25064001"))
-    median_home_value = _normalize_median(get_estimate(payload, geoid, "B25077", "B25077001"))
+    median_rent = _normalize_median(_get_estimate_flat(flat, geoid, "B25064", "B25064001"))
+    median_home_value = _normalize_median(_get_estimate_flat(flat, geoid, "B25077", "B25077001"))
 
-    transport_total = get_estimate(payload, geoid, "B08301", "B08301001")
+    transport_total = _get_estimate_flat(flat, geoid, "B08301", "B08301001")
     transport: dict[str, dict[str, float | int | None]] = {}
     for label, column_id in TRANSPORT_COLUMNS.items():
-        count = get_estimate(payload, geoid, "B08301", column_id)
+        count = _get_estimate_flat(flat, geoid, "B08301", column_id)
         transport[label] = {
             "count": count,
             "share_pct": pct(count, transport_total),
         }
 
-    education_total = get_estimate(payload, geoid, "B15003", "B15003001")
-    high_school_plus_count = sum_estimates(payload, geoid, "B15003", B15003_HIGH_SCHOOL_PLUS)
-    bachelors_plus_count = sum_estimates(payload, geoid, "B15003", B15003_BACHELORS_PLUS)
+    education_total = _get_estimate_flat(flat, geoid, "B15003", "B15003001")
+    high_school_plus_count = _sum_estimates_flat(flat, geoid, "B15003", B15003_HIGH_SCHOOL_PLUS)
+    bachelors_plus_count = _sum_estimates_flat(flat, geoid, "B15003", B15003_BACHELORS_PLUS)
 
     return {
         "geoid": geoid,
@@ -1520,40 +1625,40 @@ def compute_highlights_for_geoid(
     }
 
 
-def _metric_extractors() -> dict[str, Callable[[dict[str, Any], str], float | int | None]]:
-    return {
-        "median_age": lambda payload, geoid: get_estimate(payload, geoid, "B01002", "B01002001"),
-        "per_capita_income": lambda payload, geoid: _normalize_median(get_estimate(payload, geoid, "B19301", "B19301001")),
-        "median_household_income": lambda payload, geoid: _normalize_median(get_estimate(payload, geoid, "B19013", "B19013001")),
-        "poverty_rate": lambda payload, geoid: pct(
-            get_estimate(payload, geoid, "B17001", "B17001002"),
-            get_estimate(payload, geoid, "B17001", "B17001001"),
-        ),
-        "mean_travel_time": lambda payload, geoid: get_estimate(payload, geoid, "B08303", "B08303001"),
-        "households": lambda payload, geoid: get_estimate(payload, geoid, "B11001", "B11001001"),
-        "persons_per_household": lambda payload, geoid: get_estimate(payload, geoid, "B25010", "B25010001"),
-        "median_home_value": lambda payload, geoid: _normalize_median(get_estimate(payload, geoid, "B25077", "B25077001")),
-        "hs_or_higher_pct": lambda payload, geoid: pct(
-            sum_estimates(payload, geoid, "B15003", B15003_HIGH_SCHOOL_PLUS),
-            get_estimate(payload, geoid, "B15003", "B15003001"),
-        ),
-        "bachelors_or_higher_pct": lambda payload, geoid: pct(
-            sum_estimates(payload, geoid, "B15003", B15003_BACHELORS_PLUS),
-            get_estimate(payload, geoid, "B15003", "B15003001"),
-        ),
-        "foreign_born_pct": lambda payload, geoid: pct(
-            get_estimate(payload, geoid, "B05002", "B05002013"),
-            get_estimate(payload, geoid, "B05002", "B05002001"),
-        ),
-        "veteran_pct": lambda payload, geoid: pct(
-            get_estimate(payload, geoid, "B21001", "B21001002"),
-            get_estimate(payload, geoid, "B21001", "B21001001"),
-        ),
-        "moved_last_year_pct": lambda payload, geoid: pct(
-            sum_estimates(payload, geoid, "B07003", ["B07003004", "B07003005", "B07003006", "B07003007"]),
-            get_estimate(payload, geoid, "B07003", "B07003001"),
-        ),
-    }
+# Comparison metrics as data: ("value", table, column), ("median", table, column) for
+# medians where negative sentinels mean "no data", or ("pct", table, numerator
+# columns, denominator column).
+_COMPARISON_METRIC_SPECS: dict[str, tuple[Any, ...]] = {
+    "median_age": ("value", "B01002", "B01002001"),
+    "per_capita_income": ("median", "B19301", "B19301001"),
+    "median_household_income": ("median", "B19013", "B19013001"),
+    "poverty_rate": ("pct", "B17001", ("B17001002",), "B17001001"),
+    "mean_travel_time": ("value", "B08303", "B08303001"),
+    "households": ("value", "B11001", "B11001001"),
+    "persons_per_household": ("value", "B25010", "B25010001"),
+    "median_home_value": ("median", "B25077", "B25077001"),
+    "hs_or_higher_pct": ("pct", "B15003", tuple(B15003_HIGH_SCHOOL_PLUS), "B15003001"),
+    "bachelors_or_higher_pct": ("pct", "B15003", tuple(B15003_BACHELORS_PLUS), "B15003001"),
+    "foreign_born_pct": ("pct", "B05002", ("B05002013",), "B05002001"),
+    "veteran_pct": ("pct", "B21001", ("B21001002",), "B21001001"),
+    "moved_last_year_pct": ("pct", "B07003", ("B07003004", "B07003005", "B07003006", "B07003007"), "B07003001"),
+}
+
+
+def _eval_comparison_metric(spec: tuple[Any, ...], flat: FlatPayload, geoid: str) -> float | int | None:
+    kind, table_id = spec[0], spec[1]
+    estimate = flat.get((geoid, table_id), _EMPTY_TABLE)[0]
+    if kind == "pct":
+        numerator_ids, denominator_id = spec[2], spec[3]
+        if len(numerator_ids) == 1:
+            numerator = _numeric(estimate.get(numerator_ids[0]))
+        else:
+            numerator = _sum_columns(estimate, numerator_ids)
+        return pct(numerator, _numeric(estimate.get(denominator_id)))
+    value = _numeric(estimate.get(spec[2]))
+    if kind == "median":
+        return _normalize_median(value)
+    return value
 
 
 def _build_profile_summary(
@@ -1608,6 +1713,36 @@ def _first_selected_parent_geoid(
     return None
 
 
+def _attach_comparisons(
+    metric_map: dict[str, dict[str, Any]],
+    *,
+    base_geoid: str,
+    comparison_values_by_metric: dict[str, dict[str, float | int | None]],
+    selected_parents: list[dict[str, Any]],
+    geography_lookup: dict[str, str | None],
+) -> dict[str, list[dict[str, Any]]]:
+    # Section metric entries are the same dict objects held in metric_map, so the
+    # comparison lines are written onto each metric in the same pass that builds them.
+    comparisons: dict[str, list[dict[str, Any]]] = {}
+    for metric_id, metric in metric_map.items():
+        comparison_values = comparison_values_by_metric.get(metric_id)
+        if comparison_values is None:
+            metric["comparisons"] = []
+            continue
+        lines = _comparison_lines_for_metric(
+            metric,
+            base_geoid=base_geoid,
+            base_value=metric.get("estimate"),
+            comparison_values=comparison_values,
+            selected_parents=selected_parents,
+            geography_lookup=geography_lookup,
+        )
+        metric["comparisons"] = lines
+        if lines:
+            comparisons[metric_id] = lines
+    return comparisons
+
+
 def build_derived(
     tract_full_payload: dict[str, Any],
     comparisons_payload: dict[str, Any],
@@ -1626,11 +1761,10 @@ def build_derived(
     dict[str, dict[str, Any]],
     list[dict[str, Any]],
 ]:
-    geography_lookup: dict[str, str | None] = {}
-    for source in (tract_full_payload, comparisons_payload):
-        for geoid, meta in source.get("geography", {}).items():
-            if isinstance(meta, dict):
-                geography_lookup[geoid] = meta.get("name")
+    geography_lookup = {
+        **_geography_names(tract_full_payload),
+        **_geography_names(comparisons_payload),
+    }
     for parent in selected_parents:
         geoid = str(parent.get("geoid") or "")
         if not geoid:
@@ -1639,23 +1773,27 @@ def build_derived(
         if geoid not in geography_lookup and isinstance(display_name, str):
             geography_lookup[geoid] = display_name
 
+    tract_flat = _flatten_payload(tract_full_payload)
+    comparisons_flat = _flatten_payload(comparisons_payload)
+
     tract_name = geography_lookup.get(tract_geoid)
     tract_highlights = compute_highlights_for_geoid(
-        tract_full_payload, tract_geoid, name=tract_name
+        tract_full_payload, tract_geoid, name=tract_name, flat=tract_flat
     )
 
     comparison_highlights: dict[str, dict[str, Any]] = {}
     for geoid in comparison_geoids:
         comparison_highlights[geoid] = compute_highlights_for_geoid(
-            comparisons_payload, geoid, name=geography_lookup.get(geoid)
+            comparisons_payload, geoid, name=geography_lookup.get(geoid), flat=comparisons_flat
         )
 
-    extractors = _metric_extractors()
-    comparison_values_by_metric: dict[str, dict[str, float | int | None]] = {}
-    for metric_id, extractor in extractors.items():
-        comparison_values_by_metric[metric_id] = {
-            geoid: extractor(comparisons_payload, geoid) for geoid in comparison_geoids
+    comparison_values_by_metric: dict[str, dict[str, float | int | None]] = {
+        metric_id: {
+            geoid: _eval_comparison_metric(spec, comparisons_flat, geoid)
+            for geoid in comparison_geoids
         }
+        for metric_id, spec in _COMPARISON_METRIC_SPECS.items()
+    }
 
     comparison_geoids_set = set(comparison_geoids)
     place_geoid = _first_selected_parent_geoid(selected_parents, relation="place")
@@ -1681,37 +1819,23 @@ def build_derived(
             continue
         if kind != "tract" and geoid not in comparison_geoids_set:
             continue
-        data_payload = comparisons_payload
         if geoid == tract_geoid and geoid in tract_full_payload.get("data", {}):
-            data_payload = tract_full_payload
+            data_payload, data_flat = tract_full_payload, tract_flat
         elif geoid in comparisons_payload.get("data", {}):
-            data_payload = comparisons_payload
+            data_payload, data_flat = comparisons_payload, comparisons_flat
         elif geoid in tract_full_payload.get("data", {}):
-            data_payload = tract_full_payload
+            data_payload, data_flat = tract_full_payload, tract_flat
         else:
             continue
 
-        sections, metric_map = _build_sections_for_geoid(data_payload, geoid)
-        comparisons: dict[str, list[dict[str, Any]]] = {}
-        for metric_id, metric in metric_map.items():
-            if metric_id not in comparison_values_by_metric:
-                continue
-            base_value = metric.get("estimate")
-            lines = _comparison_lines_for_metric(
-                metric,
-                base_geoid=geoid,
-                base_value=base_value,
-                comparison_values=comparison_values_by_metric[metric_id],
-                selected_parents=selected_parents,
-                geography_lookup=geography_lookup,
-            )
-            if lines:
-                comparisons[metric_id] = lines
-
-        for section in sections:
-            for metric in section.get("metrics", []):
-                metric_id = metric.get("id")
-                metric["comparisons"] = comparisons.get(metric_id, [])
+        sections, metric_map = _build_sections_for_geoid(data_payload, geoid, data_flat)
+        comparisons = _attach_comparisons(
+            metric_map,
+            base_geoid=geoid,
+            comparison_values_by_metric=comparison_values_by_metric,
+            selected_parents=selected_parents,
+            geography_lookup=geography_lookup,
+        )
 
         geography_meta = _get_geography_meta(
             geoid=geoid,
@@ -1745,26 +1869,16 @@ def build_derived(
             tract_comparisons = comparisons
 
     if not tract_sections:
-        tract_sections, tract_metrics = _build_sections_for_geoid(tract_full_payload, tract_geoid)
-        tract_comparisons = {}
-        for metric_id, metric in tract_metrics.items():
-            if metric_id not in comparison_values_by_metric:
-                continue
-            base_value = metric.get("estimate")
-            lines = _comparison_lines_for_metric(
-                metric,
-                base_geoid=tract_geoid,
-                base_value=base_value,
-                comparison_values=comparison_values_by_metric[metric_id],
-                selected_parents=selected_parents,
-                geography_lookup=geography_lookup,
-            )
-            if lines:
-                tract_comparisons[metric_id] = lines
-        for section in tract_sections:
-            for metric in section.get("metrics", []):
-                metric_id = metric.get("id")
-                metric["comparisons"] = tract_comparisons.get(metric_id, [])
+        tract_sections, tract_metrics = _build_sections_for_geoid(
+            tract_full_payload, tract_geoid, tract_flat
+        )
+        tract_comparisons = _attach_comparisons(
+            tract_metrics,
+            base_geoid=tract_geoid,
+            comparison_values_by_metric=comparison_values_by_metric,
+            selected_parents=selected_parents,
+            geography_lookup=geography_lookup,
+        )
         geography_profiles_by_geoid.setdefault(
             tract_geoid,
             {
@@ -1812,22 +1926,26 @@ def build_derived(
     )
 
 
-def lookup_census_profile_by_point(
-    client: httpx.Client,
+def geocode_point(
+    client: httpx.Client | None,
     *,
     lat: float,
     lon: float,
-    acs: str = "latest",
-    include_parents: bool = True,
-    timeout: float = 20.0,
-    retries: int = 3,
-    requester: Callable[..., dict[str, Any]] | None = None,
+    config: ApiConfig,
+    requester: RequestJsonFn | None = None,
 ) -> dict[str, Any]:
-    requester_fn = requester or request_json
-    config = ApiConfig(acs=acs, timeout=timeout, retries=retries)
-    errors: list[dict[str, str]] = []
+    key = (round(lat, _GEOCODER_CACHE_DECIMALS), round(lon, _GEOCODER_CACHE_DECIMALS))
+    now = time.monotonic()
+    cached = _GEOCODER_CACHE.get(key)
+    if cached and now - cached[0] < _GEOCODER_CACHE_TTL:
+        with _GEOCODER_CACHE_LOCK:
+            # Hits move to the back, so eviction from the front drops the least recently used.
+            if key in _GEOCODER_CACHE:
+                _GEOCODER_CACHE.move_to_end(key)
+        return deepcopy(cached[1])
 
-    geocoder_payload = requester_fn(
+    requester_fn = requester or request_json
+    payload = requester_fn(
         client,
         CENSUS_GEOCODER_COORDINATES_URL,
         params={
@@ -1841,6 +1959,42 @@ def lookup_census_profile_by_point(
         stage="geocoder",
         config=config,
     )
+    with _GEOCODER_CACHE_LOCK:
+        if key not in _GEOCODER_CACHE and len(_GEOCODER_CACHE) >= _GEOCODER_CACHE_MAXSIZE:
+            _GEOCODER_CACHE.popitem(last=False)
+        _GEOCODER_CACHE[key] = (now, deepcopy(payload))
+    return payload
+
+
+def lookup_census_profile_by_point(
+    client: httpx.Client | None,
+    *,
+    lat: float,
+    lon: float,
+    acs: str = "latest",
+    include_parents: bool = True,
+    timeout: float = 20.0,
+    retries: int = 3,
+    requester: Callable[..., dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    requester_fn = requester or request_json
+    config = ApiConfig(acs=acs, timeout=timeout, retries=retries)
+    errors: list[dict[str, str]] = []
+    input_block = {
+        "latitude": lat,
+        "longitude": lon,
+        "acs": acs,
+        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+        "parameters": {
+            "timeout": timeout,
+            "retries": retries,
+            "include_parents": include_parents,
+        },
+    }
+
+    geocoder_payload = geocode_point(
+        client, lat=lat, lon=lon, config=config, requester=requester_fn
+    )
     tract_record = extract_first_tract(geocoder_payload)
     tract_fips = str(tract_record["GEOID"])
     tract_geoid = build_reporter_tract_geoid(tract_fips)
@@ -1863,50 +2017,64 @@ def lookup_census_profile_by_point(
     if county_geoid:
         required_geoids_by_sumlevel["050"] = county_geoid
 
-    parents_available: list[dict[str, Any]] = []
-    if not include_parents:
-        comparison_geoids, selected_parents = build_comparison_geoids(
-            tract_geoid,
-            parents=[],
-            include_parents=False,
-            required_geoids_by_sumlevel=required_geoids_by_sumlevel,
-        )
-    else:
-        parents_payload = requester_fn(
+    cache_key = (tract_geoid, zcta_geoid, county_geoid, acs, include_parents)
+    cached = _PROFILE_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _PROFILE_CACHE_TTL:
+        with _PROFILE_CACHE_LOCK:
+            # Hits move to the back, so eviction from the front drops the least recently used.
+            if cache_key in _PROFILE_CACHE:
+                _PROFILE_CACHE.move_to_end(cache_key)
+        return {"input": input_block, **deepcopy(cached[1])}
+
+    # The tract-only fetch needs nothing but the tract GEOID, so start it now and
+    # let it overlap with the parents lookup and the comparisons fetch below.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        tract_full_future = pool.submit(
+            fetch_data_show_resilient,
             client,
-            f"{CENSUS_REPORTER_BASE_URL}/1.0/geo/latest/{tract_geoid}/parents",
-            params=None,
-            stage="parents",
+            acs=acs,
+            table_ids=FULL_TRACT_TABLES,
+            geoids=[tract_geoid],
+            stage="tract_full",
             config=config,
-        )
-        parents_available = parents_payload.get("parents", [])
-        comparison_geoids, selected_parents = build_comparison_geoids(
-            tract_geoid,
-            parents_available,
-            include_parents=True,
-            required_geoids_by_sumlevel=required_geoids_by_sumlevel,
+            requester=requester_fn,
         )
 
-    tract_full_payload, tract_fetch_errors = fetch_data_show_resilient(
-        client,
-        acs=acs,
-        table_ids=FULL_TRACT_TABLES,
-        geoids=[tract_geoid],
-        stage="tract_full",
-        config=config,
-        requester=requester_fn,
-    )
-    errors.extend(tract_fetch_errors)
+        parents_available: list[dict[str, Any]] = []
+        if not include_parents:
+            comparison_geoids, selected_parents = build_comparison_geoids(
+                tract_geoid,
+                parents=[],
+                include_parents=False,
+                required_geoids_by_sumlevel=required_geoids_by_sumlevel,
+            )
+        else:
+            parents_payload = requester_fn(
+                client,
+                f"{CENSUS_REPORTER_BASE_URL}/1.0/geo/latest/{tract_geoid}/parents",
+                params=None,
+                stage="parents",
+                config=config,
+            )
+            parents_available = parents_payload.get("parents", [])
+            comparison_geoids, selected_parents = build_comparison_geoids(
+                tract_geoid,
+                parents_available,
+                include_parents=True,
+                required_geoids_by_sumlevel=required_geoids_by_sumlevel,
+            )
 
-    comparisons_payload, comparison_fetch_errors = fetch_data_show_resilient(
-        client,
-        acs=acs,
-        table_ids=COMPARISON_TABLES,
-        geoids=comparison_geoids,
-        stage="comparisons",
-        config=config,
-        requester=requester_fn,
-    )
+        comparisons_payload, comparison_fetch_errors = fetch_data_show_resilient(
+            client,
+            acs=acs,
+            table_ids=COMPARISON_TABLES,
+            geoids=comparison_geoids,
+            stage="comparisons",
+            config=config,
+            requester=requester_fn,
+        )
+        tract_full_payload, tract_fetch_errors = tract_full_future.result()
+    errors.extend(tract_fetch_errors)
     errors.extend(comparison_fetch_errors)
 
     # Census Reporter API does not expose a /data/profiles endpoint.
@@ -1932,18 +2100,7 @@ def lookup_census_profile_by_point(
     )
     release = comparisons_payload.get("release") or tract_full_payload.get("release")
 
-    return {
-        "input": {
-            "latitude": lat,
-            "longitude": lon,
-            "acs": acs,
-            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
-            "parameters": {
-                "timeout": timeout,
-                "retries": retries,
-                "include_parents": include_parents,
-            },
-        },
+    body = {
         "tract": {
             "tract_fips": tract_fips,
             "reporter_geoid": tract_geoid,
@@ -1989,6 +2146,13 @@ def lookup_census_profile_by_point(
         },
         "errors": errors,
     }
+    # Partial results are not cached so a transient upstream failure isn't pinned.
+    if not errors:
+        with _PROFILE_CACHE_LOCK:
+            if cache_key not in _PROFILE_CACHE and len(_PROFILE_CACHE) >= _PROFILE_CACHE_MAXSIZE:
+                _PROFILE_CACHE.popitem(last=False)
+            _PROFILE_CACHE[cache_key] = (time.monotonic(), deepcopy(body))
+    return {"input": input_block, **body}
 
 
 __all__ = [
@@ -2008,6 +2172,8 @@ __all__ = [
     "extract_optional_first_geography",
     "extract_optional_zcta",
     "fetch_data_show_resilient",
+    "geocode_point",
+    "get_shared_client",
     "lookup_census_profile_by_point",
     "request_json",
 ]
@@ -1,23 +1,47 @@
 from __future__ import annotations
 
+import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Sequence
 
 import httpx
 
-CENSUS_GEOCODER_COORDINATES_URL = (
-    "https://geocoding.geo.census.gov/geocoder/geographies/coordinates"
+from .census_profile_service import geocode_point
+from .upstream import (
+    CENSUS_REPORTER_BASE_URL,
+    RETRYABLE_STATUS_CODES,
+    circuit_open_message,
+    error_body_preview,
+    get_shared_client,
+    json_loads,
+    read_error_body,
+    record_upstream_failure,
+    record_upstream_success,
+    send_with_retries,
+    short_error_text,
 )
-CENSUS_REPORTER_BASE_URL = "https://api.censusreporter.org"
-RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+USER_AGENT = "groundtruth-fastapi/0.1"
+_DEFAULT_HEADERS = MappingProxyType({"User-Agent": USER_AGENT})
 NO_RELEASES_MARKERS = (
     "none of the releases had",
     "requested geo_ids",
 )
+# Census Reporter always emits the markers in this order, so one case-insensitive
+# scan replaces lowercasing the message and checking each marker separately.
+_NO_RELEASES_RE = re.compile(
+    ".*".join(re.escape(marker) for marker in NO_RELEASES_MARKERS),
+    re.IGNORECASE | re.DOTALL,
+)
 
-TABLE_IDS = [
+TABLE_IDS = (
     "B01003",
     "B01002",
     "B01001",
@@ -47,9 +71,62 @@ TABLE_IDS = [
     "B13016",
     "B21001",
     "B16001",
-]
+)
 
-KEY_TABLE_EXAMPLES = [
+# Query-string form of the full table list, joined once instead of on every request.
+_TABLE_IDS_JOINED = ",".join(TABLE_IDS)
+
+# Upper bound on concurrent requests when the bulk request falls back.
+FALLBACK_MAX_WORKERS = 8
+# Tables per request in the first fallback round; failing chunks are then bisected.
+FALLBACK_CHUNK_SIZE = 8
+
+# Table metadata fields read by _build_glossary_and_interpreted; the rest is dropped on fetch.
+_TABLE_META_KEEP = frozenset(
+    {
+        "title",
+        "simple_table_title",
+        "table_title",
+        "subject_area",
+        "universe",
+        "denominator_column_id",
+        "topics",
+        "columns",
+    }
+)
+_TABLE_DATA_KEEP = ("estimate", "error")
+
+# data/show results keyed by (acs, table ids, reporter geoid). Releases change
+# yearly, so nearby points resolving to the same block/tract reuse one fetch.
+_DATA_SHOW_CACHE: OrderedDict[
+    tuple[Any, ...], tuple[float, tuple[dict[str, Any], list[dict[str, str]]]]
+] = OrderedDict()
+_DATA_SHOW_CACHE_TTL = 86400  # seconds
+_DATA_SHOW_CACHE_MAXSIZE = 1024
+_DATA_SHOW_CACHE_LOCK = threading.Lock()
+
+# TIGER 2022 tract boundaries never change for a GEOID, so they are kept without a TTL.
+_TRACT_GEO_CACHE: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_TRACT_GEO_CACHE_MAXSIZE = 2048
+_TRACT_GEO_CACHE_LOCK = threading.Lock()
+
+# Geography levels each ACS release was seen to have no tables for, with when that
+# was learned. Later lookups skip those levels instead of re-running the fallback.
+# Only census blocks qualify: ACS publishes no block-level tables, so a missing release
+# there holds for every block. Block groups and tracts can be missing per geography,
+# so one failure must not skip them for other locations.
+_SKIPPABLE_LEVELS = frozenset({"census_block"})
+_UNSUPPORTED_LEVELS: dict[tuple[str, str], float] = {}
+_UNSUPPORTED_LEVELS_TTL = 86400  # seconds
+_UNSUPPORTED_LEVELS_LOCK = threading.Lock()
+
+# Upstream GETs currently in flight, keyed by (url, sorted params), with the
+# number of callers waiting on them. Concurrent callers asking for the same
+# resource wait on the first caller's result instead of issuing their own.
+_INFLIGHT: dict[tuple[Any, ...], tuple[Future[dict[str, Any]], list[int]]] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+KEY_TABLE_EXAMPLES = (
     "B01003",
     "B01002",
     "B19013",
@@ -59,7 +136,7 @@ KEY_TABLE_EXAMPLES = [
     "B08301",
     "B15003",
     "B17001",
-]
+)
 
 
 @dataclass(frozen=True)
@@ -76,83 +153,130 @@ class UpstreamAPIError(RuntimeError):
         self.message = message
 
 
+class NoReleasesForGeoError(UpstreamAPIError):
+    """Census Reporter has no release covering the requested geo_ids and table_ids."""
+
+
 class NoGeographyFoundError(RuntimeError):
     pass
 
 
-def _backoff_seconds(attempt: int) -> float:
-    return min(8.0, 0.5 * (2**attempt))
+def _looks_like_no_release_error(message: str) -> bool:
+    return _NO_RELEASES_RE.search(message) is not None
 
 
-def _short_error_text(text: str, limit: int = 240) -> str:
-    one_line = " ".join(text.split())
-    if len(one_line) <= limit:
-        return one_line
-    return one_line[:limit] + "..."
+def _is_no_release_error(exc: UpstreamAPIError) -> bool:
+    # request_json raises the typed error from Census Reporter's JSON "error" field;
+    # the message check still covers errors built elsewhere (e.g. injected requesters).
+    return isinstance(exc, NoReleasesForGeoError) or _looks_like_no_release_error(str(exc))
 
 
-def _looks_like_no_release_error(message: str) -> bool:
-    lowered = message.lower()
-    return all(marker in lowered for marker in NO_RELEASES_MARKERS)
+def _structured_no_release_error(body: str) -> bool:
+    try:
+        payload = json_loads(body)
+    except ValueError:
+        return False
+    error = payload.get("error") if isinstance(payload, dict) else None
+    return isinstance(error, str) and _looks_like_no_release_error(error)
 
 
 def request_json(
-    client: httpx.Client,
+    client: httpx.Client | None,
     url: str,
     *,
     params: dict[str, Any] | None,
     stage: str,
     config: ApiConfig,
 ) -> dict[str, Any]:
-    last_error: Exception | None = None
-    headers = {"User-Agent": "groundtruth-fastapi/0.1"}
-    for attempt in range(config.retries + 1):
-        try:
-            response = client.get(url, params=params, timeout=config.timeout, headers=headers)
-        except (httpx.TimeoutException, httpx.TransportError) as exc:
-            last_error = exc
-            if attempt < config.retries:
-                time.sleep(_backoff_seconds(attempt))
-                continue
-            raise UpstreamAPIError(stage, f"Network error after retries: {exc!s}") from exc
+    key = (url, tuple(sorted((params or {}).items())))
+    with _INFLIGHT_LOCK:
+        inflight = _INFLIGHT.get(key)
+        if inflight is not None:
+            inflight[1][0] += 1
+        else:
+            _INFLIGHT[key] = (Future(), [0])
 
-        status = response.status_code
-        if status in RETRYABLE_STATUS_CODES:
-            last_error = UpstreamAPIError(
-                stage, f"HTTP {status}: {_short_error_text(response.text)}"
-            )
-            if attempt < config.retries:
-                time.sleep(_backoff_seconds(attempt))
-                continue
-            raise last_error
+    if inflight is not None:
+        # Callers may mutate what they get back (payloads are merged in place).
+        return deepcopy(inflight[0].result())
+
+    try:
+        payload = _request_json_uncoalesced(
+            client, url, params=params, stage=stage, config=config
+        )
+    except BaseException as exc:
+        with _INFLIGHT_LOCK:
+            future, _ = _INFLIGHT.pop(key)
+        future.set_exception(exc)
+        raise
 
-        if 400 <= status < 500:
-            raise UpstreamAPIError(stage, f"HTTP {status}: {_short_error_text(response.text)}")
+    with _INFLIGHT_LOCK:
+        future, (waiters,) = _INFLIGHT.pop(key)
+    # Waiters copy from a snapshot so the payload returned here stays private.
+    future.set_result(deepcopy(payload) if waiters else payload)
+    return payload
 
-        try:
-            return response.json()
-        except ValueError as exc:
-            raise UpstreamAPIError(
-                stage, f"Invalid JSON in upstream response (HTTP {status})"
-            ) from exc
 
-    if last_error is not None:
-        raise UpstreamAPIError(stage, f"Failed request after retries: {last_error!s}")
-    raise UpstreamAPIError(stage, "Failed request after retries.")
+def _request_json_uncoalesced(
+    client: httpx.Client | None,
+    url: str,
+    *,
+    params: dict[str, Any] | None,
+    stage: str,
+    config: ApiConfig,
+) -> dict[str, Any]:
+    # Default to the process-wide pooled client so calls reuse open connections.
+    client = client or get_shared_client()
+    # The per-host breaker state lives in upstream and is shared with
+    # census_profile_service, so an outage seen by either service makes both fail fast.
+    host = httpx.URL(url).host
+    circuit_open = circuit_open_message(host)
+    if circuit_open:
+        raise UpstreamAPIError(stage, circuit_open)
+    request = client.build_request(
+        "GET", url, params=params, timeout=config.timeout, headers=_DEFAULT_HEADERS
+    )
+    try:
+        # Error bodies are left unread and only previewed below.
+        response = send_with_retries(client, request, config.retries)
+    except httpx.TransportError as exc:
+        record_upstream_failure(host)
+        raise UpstreamAPIError(stage, f"Network error after retries: {exc!s}") from exc
+
+    status = response.status_code
+    if status in RETRYABLE_STATUS_CODES:
+        record_upstream_failure(host)
+        raise UpstreamAPIError(stage, f"HTTP {status}: {error_body_preview(response)}")
+
+    if 400 <= status < 500:
+        body = read_error_body(response)
+        message = f"HTTP {status}: {short_error_text(body)}"
+        if _structured_no_release_error(body):
+            raise NoReleasesForGeoError(stage, message)
+        raise UpstreamAPIError(stage, message)
+
+    record_upstream_success(host)
+    try:
+        # orjson.JSONDecodeError subclasses ValueError, so one handler covers both parsers.
+        return json_loads(response.content)
+    except ValueError as exc:
+        raise UpstreamAPIError(
+            stage, f"Invalid JSON in upstream response (HTTP {status})"
+        ) from exc
 
 
 def fetch_data_show(
-    client: httpx.Client,
+    client: httpx.Client | None,
     *,
     acs: str,
-    table_ids: list[str],
+    table_ids: Sequence[str],
     geoid: str,
     stage: str,
     config: ApiConfig,
 ) -> dict[str, Any]:
     url = f"{CENSUS_REPORTER_BASE_URL}/1.0/data/show/{acs}"
     params = {
-        "table_ids": ",".join(table_ids),
+        "table_ids": _TABLE_IDS_JOINED if table_ids is TABLE_IDS else ",".join(table_ids),
         "geo_ids": geoid,
     }
     return request_json(client, url, params=params, stage=stage, config=config)
@@ -194,11 +318,68 @@ def merge_data_show_payload(base: dict[str, Any], incoming: dict[str, Any]) -> N
                     base_data[geoid].update(geoid_tables)
 
 
+def _prune_data_show_payload(payload: dict[str, Any]) -> None:
+    """Drop table metadata and per-table fields nothing downstream reads, in place."""
+    tables = payload.get("tables")
+    if isinstance(tables, dict):
+        for table_id, meta in tables.items():
+            if isinstance(meta, dict):
+                tables[table_id] = {key: value for key, value in meta.items() if key in _TABLE_META_KEEP}
+
+    data = payload.get("data")
+    if isinstance(data, dict):
+        for geoid_tables in data.values():
+            if not isinstance(geoid_tables, dict):
+                continue
+            for table_id, table_data in geoid_tables.items():
+                if isinstance(table_data, dict):
+                    geoid_tables[table_id] = {
+                        key: table_data[key] for key in _TABLE_DATA_KEEP if key in table_data
+                    }
+
+
 def fetch_data_show_resilient(
-    client: httpx.Client,
+    client: httpx.Client | None,
+    *,
+    acs: str,
+    table_ids: Sequence[str],
+    geoid: str,
+    stage: str,
+    config: ApiConfig,
+) -> tuple[dict[str, Any], list[dict[str, str]]]:
+    cache_key = (acs, tuple(table_ids), geoid)
+    cached = _DATA_SHOW_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _DATA_SHOW_CACHE_TTL:
+        with _DATA_SHOW_CACHE_LOCK:
+            # Hits move to the back, so eviction from the front drops the least recently used.
+            if cache_key in _DATA_SHOW_CACHE:
+                _DATA_SHOW_CACHE.move_to_end(cache_key)
+        return deepcopy(cached[1])
+
+    payload, errors = _fetch_data_show_uncached(
+        client,
+        acs=acs,
+        table_ids=table_ids,
+        geoid=geoid,
+        stage=stage,
+        config=config,
+    )
+    _prune_data_show_payload(payload)
+    # Missing releases are stable for the TTL; any other per-table failure (timeouts,
+    # 5xx, an open circuit) is not cached so the table is retried on the next lookup.
+    if all(_looks_like_no_release_error(error["message"]) for error in errors if "table_id" in error):
+        with _DATA_SHOW_CACHE_LOCK:
+            if cache_key not in _DATA_SHOW_CACHE and len(_DATA_SHOW_CACHE) >= _DATA_SHOW_CACHE_MAXSIZE:
+                _DATA_SHOW_CACHE.popitem(last=False)
+            _DATA_SHOW_CACHE[cache_key] = (time.monotonic(), deepcopy((payload, errors)))
+    return payload, errors
+
+
+def _fetch_data_show_uncached(
+    client: httpx.Client | None,
     *,
     acs: str,
-    table_ids: list[str],
+    table_ids: Sequence[str],
     geoid: str,
     stage: str,
     config: ApiConfig,
@@ -214,38 +395,81 @@ def fetch_data_show_resilient(
         )
         return payload, []
     except UpstreamAPIError as exc:
-        if not _looks_like_no_release_error(str(exc)):
+        if not _is_no_release_error(exc):
             raise
 
-    merged = new_empty_data_show_payload()
-    errors: list[dict[str, str]] = []
-    successful_tables = 0
-
-    for table_id in table_ids:
-        table_stage = f"{stage}:{table_id}"
+    def fetch_chunk(chunk: Sequence[str]) -> dict[str, Any] | UpstreamAPIError:
         try:
-            payload = fetch_data_show(
+            return fetch_data_show(
                 client,
                 acs=acs,
-                table_ids=[table_id],
+                table_ids=chunk,
                 geoid=geoid,
-                stage=table_stage,
+                stage=f"{stage}:{','.join(chunk)}",
                 config=config,
             )
-            merge_data_show_payload(merged, payload)
-            successful_tables += 1
-        except UpstreamAPIError as table_exc:
-            errors.append(
-                {
-                    "stage": stage,
-                    "table_id": table_id,
-                    "message": str(table_exc),
-                }
-            )
+        except UpstreamAPIError as chunk_exc:
+            return chunk_exc
+
+    # Census Reporter rejects a whole request if any one table is unsupported, and
+    # usually only a few are. Fetch fixed-size chunks, then bisect the failing ones
+    # round by round until each unsupported table is isolated on its own. If a whole
+    # round fails (e.g. the geography level is barely covered), bisecting would cost
+    # more than going straight to per-table requests, so split to single tables.
+    pending = [
+        table_ids[start : start + FALLBACK_CHUNK_SIZE]
+        for start in range(0, len(table_ids), FALLBACK_CHUNK_SIZE)
+    ]
+    succeeded: list[tuple[Sequence[str], dict[str, Any]]] = []
+    failed: list[tuple[str, UpstreamAPIError]] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(FALLBACK_MAX_WORKERS, len(table_ids)))) as pool:
+        while pending:
+            succeeded_before = len(succeeded)
+            failing: list[Sequence[str]] = []
+            for chunk, result in zip(pending, pool.map(fetch_chunk, pending)):
+                if not isinstance(result, UpstreamAPIError):
+                    succeeded.append((chunk, result))
+                elif len(chunk) == 1:
+                    failed.append((chunk[0], result))
+                else:
+                    failing.append(chunk)
+            if len(succeeded) == succeeded_before:
+                pending = [[table_id] for chunk in failing for table_id in chunk]
+            else:
+                pending = [
+                    half
+                    for chunk in failing
+                    for half in (chunk[: len(chunk) // 2], chunk[len(chunk) // 2 :])
+                ]
+
+    # Merge and report in the original table order, as the serial loop did.
+    table_order = {table_id: index for index, table_id in enumerate(table_ids)}
+    succeeded.sort(key=lambda item: table_order[item[0][0]])
+    failed.sort(key=lambda item: table_order[item[0]])
+
+    merged = new_empty_data_show_payload()
+    successful_tables = 0
+    for chunk, payload in succeeded:
+        merge_data_show_payload(merged, payload)
+        successful_tables += len(chunk)
+
+    errors: list[dict[str, str]] = [
+        {
+            "stage": stage,
+            "table_id": table_id,
+            "message": str(table_exc),
+        }
+        for table_id, table_exc in failed
+    ]
 
     if successful_tables == 0:
         first = errors[0]["message"] if errors else "No fallback requests succeeded."
-        raise UpstreamAPIError(stage, f"All per-table fallback requests failed. First error: {first}")
+        error_type = (
+            NoReleasesForGeoError
+            if failed and all(_is_no_release_error(table_exc) for _, table_exc in failed)
+            else UpstreamAPIError
+        )
+        raise error_type(stage, f"All per-table fallback requests failed. First error: {first}")
 
     if errors:
         errors.insert(
@@ -262,6 +486,23 @@ def fetch_data_show_resilient(
     return merged, errors
 
 
+def _known_unsupported_levels(acs: str) -> set[str]:
+    now = time.monotonic()
+    with _UNSUPPORTED_LEVELS_LOCK:
+        return {
+            level
+            for (release, level), learned_at in _UNSUPPORTED_LEVELS.items()
+            if release == acs and now - learned_at < _UNSUPPORTED_LEVELS_TTL
+        }
+
+
+def _mark_level_unsupported(acs: str, level: str) -> None:
+    if level not in _SKIPPABLE_LEVELS:
+        return
+    with _UNSUPPORTED_LEVELS_LOCK:
+        _UNSUPPORTED_LEVELS[(acs, level)] = time.monotonic()
+
+
 def _extract_first_geography(
     geocoder_payload: dict[str, Any],
     geography_name: str,
@@ -272,46 +513,72 @@ def _extract_first_geography(
     return None
 
 
-def _build_reporter_geoid(level: str, geoid: str | None) -> str | None:
-    if not geoid:
-        return None
+# Geography levels from smallest to largest; larger levels back-fill smaller ones.
+_ORDERED_LEVELS = ("census_block", "census_block_group", "census_tract")
+_LEVEL_INDEX = {level: index for index, level in enumerate(_ORDERED_LEVELS)}
 
-    if level == "census_block":
-        return f"10000US{geoid}" if len(geoid) == 15 and geoid.isdigit() else None
-    if level == "census_block_group":
-        return f"15000US{geoid}" if len(geoid) == 12 and geoid.isdigit() else None
-    if level == "census_tract":
-        return f"14000US{geoid}" if len(geoid) == 11 and geoid.isdigit() else None
-    return None
+# Census Reporter summary-level prefix and FIPS GEOID pattern per level. FIPS codes
+# are ASCII digits only, which str.isdigit() does not guarantee.
+_LEVEL_SPEC = {
+    "census_block": ("10000US", re.compile(r"[0-9]{15}")),
+    "census_block_group": ("15000US", re.compile(r"[0-9]{12}")),
+    "census_tract": ("14000US", re.compile(r"[0-9]{11}")),
+}
 
 
-def _list_available_tables(payload: dict[str, Any], geoid: str, requested: list[str]) -> list[str]:
-    geoid_tables = payload.get("data", {}).get(geoid, {})
-    available: list[str] = []
-    for table_id in requested:
-        estimate = geoid_tables.get(table_id, {}).get("estimate")
-        if isinstance(estimate, dict) and len(estimate) > 0:
-            available.append(table_id)
-    return available
+def geocode_tract(
+    client: httpx.Client | None,
+    *,
+    lat: float,
+    lon: float,
+    config: ApiConfig,
+) -> dict[str, Any] | None:
+    # Asks for all layers (not just tracts) so the boundary, smallest-geography and
+    # profile lookups for a point all share one geocoder cache entry.
+    geocoder_payload = geocode_point(
+        client,
+        lat=lat,
+        lon=lon,
+        config=config,
+        requester=request_json,
+    )
+    return _extract_first_geography(geocoder_payload, "Census Tracts")
 
 
-def _build_table_glossary(payload: dict[str, Any], requested: list[str]) -> dict[str, Any]:
-    tables = payload.get("tables", {})
-    out: dict[str, Any] = {}
+def fetch_tract_geojson(
+    client: httpx.Client | None,
+    *,
+    reporter_geoid: str,
+    config: ApiConfig,
+) -> dict[str, Any]:
+    cached = _TRACT_GEO_CACHE.get(reporter_geoid)
+    if cached is not None:
+        with _TRACT_GEO_CACHE_LOCK:
+            # Hits move to the back, so eviction from the front drops the least recently used.
+            if reporter_geoid in _TRACT_GEO_CACHE:
+                _TRACT_GEO_CACHE.move_to_end(reporter_geoid)
+        return deepcopy(cached)
+
+    geojson = request_json(
+        client,
+        f"{CENSUS_REPORTER_BASE_URL}/1.0/geo/tiger2022/{reporter_geoid}",
+        params={"geom": "true"},
+        stage="tract_geo",
+        config=config,
+    )
+    with _TRACT_GEO_CACHE_LOCK:
+        if reporter_geoid not in _TRACT_GEO_CACHE and len(_TRACT_GEO_CACHE) >= _TRACT_GEO_CACHE_MAXSIZE:
+            _TRACT_GEO_CACHE.popitem(last=False)
+        _TRACT_GEO_CACHE[reporter_geoid] = deepcopy(geojson)
+    return geojson
 
-    for table_id in requested:
-        meta = tables.get(table_id, {}) if isinstance(tables, dict) else {}
-        out[table_id] = {
-            "table_id": table_id,
-            "title": meta.get("title") or meta.get("simple_table_title") or meta.get("table_title"),
-            "table_title": meta.get("table_title"),
-            "subject_area": meta.get("subject_area"),
-            "universe": meta.get("universe"),
-            "denominator_column_id": meta.get("denominator_column_id"),
-            "topics": meta.get("topics"),
-            "columns": meta.get("columns") if isinstance(meta.get("columns"), dict) else {},
-        }
-    return out
+
+def _build_reporter_geoid(level: str, geoid: str | None) -> str | None:
+    spec = _LEVEL_SPEC.get(level)
+    if not geoid or spec is None:
+        return None
+    prefix, pattern = spec
+    return f"{prefix}{geoid}" if pattern.fullmatch(geoid) else None
 
 
 def _has_estimates(table_data: dict[str, Any] | None) -> bool:
@@ -321,15 +588,18 @@ def _has_estimates(table_data: dict[str, Any] | None) -> bool:
     return isinstance(estimate, dict) and len(estimate) > 0
 
 
+def _list_available_tables(payload: dict[str, Any], geoid: str, requested: Sequence[str]) -> list[str]:
+    geoid_tables = (payload.get("data") or {}).get(geoid) or {}
+    return [table_id for table_id in requested if _has_estimates(geoid_tables.get(table_id))]
+
+
 def _build_effective_tables_payload(
     *,
-    requested: list[str],
+    requested: Sequence[str],
     selected_level: str,
     candidates_with_payload: list[dict[str, Any]],
 ) -> dict[str, Any]:
-    ordered_levels = ["census_block", "census_block_group", "census_tract"]
-    selected_index = ordered_levels.index(selected_level)
-    allowed_levels = ordered_levels[selected_index:]
+    allowed_levels = list(_ORDERED_LEVELS[_LEVEL_INDEX[selected_level] :])
     allowed_set = set(allowed_levels)
 
     level_to_candidate = {
@@ -350,37 +620,55 @@ def _build_effective_tables_payload(
         if release is None and payload.get("release") is not None:
             release = payload.get("release")
 
-    for table_id in requested:
-        for candidate in merge_candidates:
-            payload = candidate.get("payload", {})
-            reporter_geoid = candidate.get("reporter_geoid")
-            source_geoid = candidate.get("source_geoid")
-            level = candidate.get("level")
-
-            geoid_tables = payload.get("data", {}).get(reporter_geoid, {})
-            table_data = geoid_tables.get(table_id, {})
-            if not _has_estimates(table_data):
+    # Per-candidate lookups are constant across tables, so resolve them once.
+    expanded_candidates = []
+    for candidate in merge_candidates:
+        payload = candidate.get("payload", {})
+        reporter_geoid = candidate.get("reporter_geoid")
+        expanded_candidates.append(
+            (
+                candidate.get("level"),
+                candidate.get("source_geoid"),
+                reporter_geoid,
+                payload.get("data", {}).get(reporter_geoid, {}),
+                payload.get("tables", {}),
+                payload.get("geography", {}),
+            )
+        )
+
+    # Walk each candidate's tables once, smallest level first, so every table is
+    # taken from the first level that has estimates for it.
+    requested_set = set(requested)
+    chosen: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = {}
+    for expanded in expanded_candidates:
+        for table_id, table_data in expanded[3].items():
+            if table_id in chosen or table_id not in requested_set or not _has_estimates(table_data):
                 continue
+            chosen[table_id] = (expanded, table_data)
 
-            by_table[table_id] = {
-                "estimate": table_data.get("estimate") if isinstance(table_data.get("estimate"), dict) else {},
-                "error": table_data.get("error") if isinstance(table_data.get("error"), dict) else {},
-            }
+    # Emit in requested order so the output dicts keep their original key order.
+    for table_id in requested:
+        if table_id not in chosen:
+            continue
+        (level, source_geoid, reporter_geoid, _, tables_meta, geography_meta), table_data = chosen[table_id]
+        by_table[table_id] = {
+            "estimate": table_data.get("estimate") if isinstance(table_data.get("estimate"), dict) else {},
+            "error": table_data.get("error") if isinstance(table_data.get("error"), dict) else {},
+        }
 
-            table_meta = payload.get("tables", {}).get(table_id, {})
-            tables[table_id] = table_meta if isinstance(table_meta, dict) else {}
+        table_meta = tables_meta.get(table_id, {})
+        tables[table_id] = table_meta if isinstance(table_meta, dict) else {}
 
-            geoid_meta = payload.get("geography", {}).get(reporter_geoid)
-            if geoid_meta is not None:
-                geography[reporter_geoid] = geoid_meta
+        geoid_meta = geography_meta.get(reporter_geoid)
+        if geoid_meta is not None:
+            geography[reporter_geoid] = geoid_meta
 
-            table_sources[table_id] = {
-                "level": level,
-                "source_geoid": source_geoid,
-                "reporter_geoid": reporter_geoid,
-                "is_fallback_from_selected": level != selected_level,
-            }
-            break
+        table_sources[table_id] = {
+            "level": level,
+            "source_geoid": source_geoid,
+            "reporter_geoid": reporter_geoid,
+            "is_fallback_from_selected": level != selected_level,
+        }
 
     available_table_ids = [table_id for table_id in requested if table_id in by_table]
     unavailable_table_ids = [table_id for table_id in requested if table_id not in by_table]
@@ -410,36 +698,63 @@ def _first_estimate_column(
         return None
     if denominator_column_id and denominator_column_id in estimate:
         return denominator_column_id
-    return next(iter(estimate.keys()))
+    return next(iter(estimate))
 
 
-def _build_interpreted_examples(
+def _build_glossary_and_interpreted(
+    tables: dict[str, Any],
     by_table_data: dict[str, Any],
-    glossary: dict[str, Any],
-    requested: list[str],
-) -> dict[str, Any]:
+    requested: Sequence[str],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Build the table glossary and the interpreted examples in one pass over the tables."""
+    glossary: dict[str, Any] = {}
     by_table: dict[str, Any] = {}
+    if not isinstance(tables, dict):
+        tables = {}
     for table_id in requested:
-        meta = glossary.get(table_id, {})
+        meta = tables.get(table_id) or {}
+        title = meta.get("title") or meta.get("simple_table_title") or meta.get("table_title")
+        denominator_column_id = meta.get("denominator_column_id")
+        columns = meta.get("columns")
+        if not isinstance(columns, dict):
+            columns = {}
+
+        glossary[table_id] = {
+            "table_id": table_id,
+            "title": title,
+            "table_title": meta.get("table_title"),
+            "subject_area": meta.get("subject_area"),
+            "universe": meta.get("universe"),
+            "denominator_column_id": denominator_column_id,
+            "topics": meta.get("topics"),
+            "columns": columns,
+        }
+
         table_data = by_table_data.get(table_id, {})
+        column_id = _first_estimate_column(table_data, denominator_column_id)
+        if column_id:
+            estimate = table_data.get("estimate", {}).get(column_id)
+            margin_of_error = table_data.get("error", {}).get(column_id)
+            column_label = columns.get(column_id, {}).get("name")
+        else:
+            estimate = margin_of_error = column_label = None
 
-        column_id = _first_estimate_column(table_data, meta.get("denominator_column_id"))
-        estimate = table_data.get("estimate", {}).get(column_id) if column_id else None
-        margin_of_error = table_data.get("error", {}).get(column_id) if column_id else None
+        # The title is only lowercased for the rare negative estimate.
+        is_sentinel_negative_median = (
+            isinstance(estimate, (int, float)) and estimate < 0 and "median" in str(title or "").lower()
+        )
 
         by_table[table_id] = {
             "table_id": table_id,
-            "title": meta.get("title"),
+            "title": title,
             "column_id": column_id,
             "estimate": estimate,
             "margin_of_error": margin_of_error,
-            "column_label": meta.get("columns", {}).get(column_id, {}).get("name") if column_id else None,
-            "is_sentinel_negative_median": bool(
-                isinstance(estimate, (int, float)) and estimate < 0 and "median" in str(meta.get("title", "")).lower()
-            ),
+            "column_label": column_label,
+            "is_sentinel_negative_median": is_sentinel_negative_median,
         }
 
-    return {
+    interpreted = {
         "key_examples": {table_id: by_table.get(table_id) for table_id in KEY_TABLE_EXAMPLES},
         "by_table": by_table,
         "notes": [
@@ -450,10 +765,11 @@ def _build_interpreted_examples(
             "negative medians are sentinel values for unavailable medians in some geographies.",
         ],
     }
+    return glossary, interpreted
 
 
 def lookup_smallest_census_by_point(
-    client: httpx.Client,
+    client: httpx.Client | None,
     *,
     lat: float,
     lon: float,
@@ -461,19 +777,13 @@ def lookup_smallest_census_by_point(
 ) -> dict[str, Any]:
     config = ApiConfig(acs=acs)
 
-    geocoder_payload = request_json(
+    # Same all-layers geocoder request as the profile lookup, so share its point cache.
+    geocoder_payload = geocode_point(
         client,
-        CENSUS_GEOCODER_COORDINATES_URL,
-        params={
-            "x": lon,
-            "y": lat,
-            "benchmark": "Public_AR_Current",
-            "vintage": "Current_Current",
-            "layers": "all",
-            "format": "json",
-        },
-        stage="geocoder",
+        lat=lat,
+        lon=lon,
         config=config,
+        requester=request_json,
     )
 
     block = _extract_first_geography(geocoder_payload, "2020 Census Blocks")
@@ -507,11 +817,48 @@ def lookup_smallest_census_by_point(
     attempt_results: list[dict[str, Any]] = []
     selected_payload: dict[str, Any] | None = None
     selected_errors: list[dict[str, str]] = []
+    available_table_ids: list[str] = []
     candidates_with_payload: list[dict[str, Any]] = []
 
-    for candidate in attempts:
+    skip_levels = _known_unsupported_levels(acs)
+
+    def fetch_level(
+        candidate: dict[str, Any],
+    ) -> tuple[dict[str, Any], list[dict[str, str]]] | UpstreamAPIError | None:
+        reporter_geoid = candidate.get("reporter_geoid")
+        if not reporter_geoid or candidate["level"] in skip_levels:
+            return None
+        try:
+            return fetch_data_show_resilient(
+                client,
+                acs=acs,
+                table_ids=TABLE_IDS,
+                geoid=reporter_geoid,
+                stage=f"data_show:{candidate['level']}",
+                config=config,
+            )
+        except UpstreamAPIError as exc:
+            return exc
+
+    # Every level is fetched regardless (larger levels back-fill missing tables), so
+    # run them concurrently and keep the block -> block group -> tract processing order.
+    with ThreadPoolExecutor(max_workers=len(attempts)) as pool:
+        level_results = list(pool.map(fetch_level, attempts))
+
+    for candidate, result in zip(attempts, level_results):
         reporter_geoid = candidate.get("reporter_geoid")
-        if not reporter_geoid:
+        if result is None and reporter_geoid:
+            attempt_results.append(
+                {
+                    **candidate,
+                    "status": "skipped_known_unsupported",
+                    "available_tables": [],
+                    "available_count": 0,
+                    "error": f"No tables were available at this level for {acs} on a recent lookup.",
+                }
+            )
+            continue
+        if result is None:
             attempt_results.append(
                 {
                     **candidate,
@@ -523,23 +870,10 @@ def lookup_smallest_census_by_point(
             )
             continue
 
-        stage = f"data_show:{candidate['level']}"
-        try:
-            payload, fallback_errors = fetch_data_show_resilient(
-                client,
-                acs=acs,
-                table_ids=TABLE_IDS,
-                geoid=reporter_geoid,
-                stage=stage,
-                config=config,
-            )
-        except UpstreamAPIError as exc:
-            message = str(exc)
-            unsupported = _looks_like_no_release_error(message) or (
-                "all per-table fallback requests failed" in message.lower()
-                and _looks_like_no_release_error(message)
-            )
-            if unsupported:
+        if isinstance(result, UpstreamAPIError):
+            message = str(result)
+            if _is_no_release_error(result):
+                _mark_level_unsupported(acs, candidate["level"])
                 attempt_results.append(
                     {
                         **candidate,
@@ -550,8 +884,9 @@ def lookup_smallest_census_by_point(
                     }
                 )
                 continue
-            raise
+            raise result
 
+        payload, fallback_errors = result
         available_tables = _list_available_tables(payload, reporter_geoid, TABLE_IDS)
         if not available_tables:
             attempt_results.append(
@@ -578,6 +913,7 @@ def lookup_smallest_census_by_point(
             selected = candidate
             selected_payload = payload
             selected_errors = fallback_errors
+            available_table_ids = available_tables
             status = "selected"
         else:
             status = "available_larger_level"
@@ -598,19 +934,17 @@ def lookup_smallest_census_by_point(
         )
 
     selected_geoid = selected["reporter_geoid"]
-    available_table_ids = _list_available_tables(selected_payload, selected_geoid, TABLE_IDS)
-    unavailable_table_ids = [table_id for table_id in TABLE_IDS if table_id not in available_table_ids]
+    available_set = set(available_table_ids)
+    unavailable_table_ids = [table_id for table_id in TABLE_IDS if table_id not in available_set]
 
     effective_data = _build_effective_tables_payload(
         requested=TABLE_IDS,
         selected_level=selected["level"],
         candidates_with_payload=candidates_with_payload,
     )
-    effective_payload_for_glossary = {"tables": effective_data.get("tables", {})}
-    table_glossary = _build_table_glossary(effective_payload_for_glossary, TABLE_IDS)
-    interpreted = _build_interpreted_examples(
+    table_glossary, interpreted = _build_glossary_and_interpreted(
+        effective_data.get("tables", {}),
         effective_data.get("by_table", {}),
-        table_glossary,
         TABLE_IDS,
     )
 
@@ -636,7 +970,7 @@ def lookup_smallest_census_by_point(
         },
         "tables": {
             "requested_count": len(TABLE_IDS),
-            "requested_table_ids": TABLE_IDS,
+            "requested_table_ids": list(TABLE_IDS),
             "available_count": len(available_table_ids),
             "available_table_ids": available_table_ids,
             "unavailable_count": len(unavailable_table_ids),
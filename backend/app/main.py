@@ -1,24 +1,31 @@
 from __future__ import annotations
 
+import json
 import os
 import sys
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
-import httpx
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
 from .census_service import (
-    CENSUS_GEOCODER_COORDINATES_URL,
-    CENSUS_REPORTER_BASE_URL,
     ApiConfig,
     NoGeographyFoundError,
     UpstreamAPIError,
-    _extract_first_geography,
-    request_json,
+    fetch_tract_geojson,
+    geocode_tract,
 )
 from .census_profile_service import (
+    ApiConfig as ProfileApiConfig,
     NoTractFoundError,
+    UpstreamAPIError as ProfileUpstreamAPIError,
+    build_reporter_tract_geoid,
+    extract_first_tract,
+    geocode_point,
+    get_shared_client,
     lookup_census_profile_by_point,
 )
 
@@ -73,18 +80,73 @@ def census_by_point(
     include_parents: bool = Query(True),
 ) -> dict:
     try:
-        with httpx.Client(follow_redirects=True) as client:
-            return lookup_census_profile_by_point(
+        return lookup_census_profile_by_point(
+            get_shared_client(),
+            lat=lat,
+            lon=lon,
+            acs=acs,
+            include_parents=include_parents,
+        )
+    except NoTractFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ProfileUpstreamAPIError as exc:
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
+
+
+def _ndjson_line(stage: str, data: Any) -> bytes:
+    return json.dumps({"stage": stage, "data": data}, separators=(",", ":")).encode() + b"\n"
+
+
+@app.get("/api/census/by-point/stream")
+def census_by_point_stream(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    acs: str = Query("latest"),
+    include_parents: bool = Query(True),
+) -> StreamingResponse:
+    """Stream the /api/census/by-point lookup as NDJSON.
+
+    The geocoded tract is sent as a ``geocoder`` line as soon as it resolves, and
+    the full profile follows as a ``profile`` line. Failures after the first line
+    arrive as an ``error`` line because the status code has already been sent.
+    """
+    client = get_shared_client()
+    try:
+        geocoder_payload = geocode_point(client, lat=lat, lon=lon, config=ProfileApiConfig(acs=acs))
+        tract_record = extract_first_tract(geocoder_payload)
+        tract_fips = str(tract_record["GEOID"])
+        # Validate before streaming: once the 200 is sent, a failure can't change it.
+        reporter_geoid = build_reporter_tract_geoid(tract_fips)
+    except NoTractFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except (ProfileUpstreamAPIError, ValueError) as exc:
+        # ValueError: the geocoder returned a tract GEOID in an unexpected format.
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
+
+    def _stream() -> Iterator[bytes]:
+        yield _ndjson_line(
+            "geocoder",
+            {
+                "tract_fips": tract_fips,
+                "reporter_geoid": reporter_geoid,
+                "geocoder_tract_record": tract_record,
+            },
+        )
+        try:
+            # The geocoder response is cached, so the lookup starts from the tract.
+            profile = lookup_census_profile_by_point(
                 client,
                 lat=lat,
                 lon=lon,
                 acs=acs,
                 include_parents=include_parents,
             )
-    except NoTractFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except UpstreamAPIError as exc:
-        raise HTTPException(status_code=502, detail=str(exc)) from exc
+        except (NoTractFoundError, ProfileUpstreamAPIError, UpstreamAPIError) as exc:
+            yield _ndjson_line("error", {"detail": str(exc)})
+            return
+        yield _ndjson_line("profile", profile)
+
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
 
 
 @app.get("/api/pois/nearby")
@@ -166,44 +228,21 @@ def census_tract_geo(
     config = ApiConfig(acs="latest")
 
     try:
-        with httpx.Client(follow_redirects=True) as client:
-            geocoder_payload = request_json(
-                client,
-                CENSUS_GEOCODER_COORDINATES_URL,
-                params={
-                    "x": lon,
-                    "y": lat,
-                    "benchmark": "Public_AR_Current",
-                    "vintage": "Current_Current",
-                    "layers": "Census Tracts",
-                    "format": "json",
-                },
-                stage="geocoder",
-                config=config,
+        client = get_shared_client()
+        tract = geocode_tract(client, lat=lat, lon=lon, config=config)
+        if not tract:
+            raise NoGeographyFoundError(
+                "No Census tract found for the provided coordinates."
             )
 
-            tract = _extract_first_geography(geocoder_payload, "Census Tracts")
-            if not tract:
-                raise NoGeographyFoundError(
-                    "No Census tract found for the provided coordinates."
-                )
-
-            raw_geoid = tract.get("GEOID", "")
-            if len(raw_geoid) != 11 or not raw_geoid.isdigit():
-                raise NoGeographyFoundError(
-                    f"Unexpected tract GEOID format: {raw_geoid!r}"
-                )
-
-            reporter_geoid = f"14000US{raw_geoid}"
-            geo_url = f"{CENSUS_REPORTER_BASE_URL}/1.0/geo/tiger2022/{reporter_geoid}"
-            geojson = request_json(
-                client,
-                geo_url,
-                params={"geom": "true"},
-                stage="tract_geo",
-                config=config,
+        raw_geoid = tract.get("GEOID", "")
+        if len(raw_geoid) != 11 or not raw_geoid.isdigit():
+            raise NoGeographyFoundError(
+                f"Unexpected tract GEOID format: {raw_geoid!r}"
             )
-            return geojson
+
+        reporter_geoid = f"14000US{raw_geoid}"
+        return fetch_tract_geojson(client, reporter_geoid=reporter_geoid, config=config)
 
     except NoGeographyFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import atexit
+import contextlib
+import importlib.util
+import random
+import threading
+import time
+from typing import Any
+
+import httpx
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup; stdlib json parses the same payloads.
+    from json import loads as json_loads
+
+
+CENSUS_GEOCODER_COORDINATES_URL = (
+    "https://geocoding.geo.census.gov/geocoder/geographies/coordinates"
+)
+CENSUS_REPORTER_BASE_URL = "https://api.censusreporter.org"
+USER_AGENT = "groundtruth-census-tools/0.2"
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Ceiling on how long an upstream Retry-After header can make a single retry wait.
+RETRY_AFTER_MAX_SECONDS = 30.0
+# Error bodies are only read this far; proxies can return multi-MB HTML error pages.
+ERROR_BODY_PREVIEW_BYTES = 4096
+
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``); fall back to HTTP/1.1.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_SHARED_CLIENT: httpx.Client | None = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+# Per-host circuit breaker: after enough transient failures inside the window,
+# calls to that host fail fast for the cooldown instead of tying up workers on
+# retries. Values are (failure_count, window_start_or_opened_at).
+_BREAKER_STATE: dict[str, tuple[int, float]] = {}
+_BREAKER_FAILURE_THRESHOLD = 5
+_BREAKER_WINDOW = 10.0  # seconds
+_BREAKER_COOLDOWN = 30.0  # seconds
+_BREAKER_LOCK = threading.Lock()
+
+# Bulkheads: caps on concurrent in-flight requests per upstream host, shared by
+# every caller in the process so a burst of lookups can't flood either API.
+_BULKHEADS: dict[str, threading.BoundedSemaphore] = {
+    httpx.URL(CENSUS_REPORTER_BASE_URL).host: threading.BoundedSemaphore(16),
+    httpx.URL(CENSUS_GEOCODER_COORDINATES_URL).host: threading.BoundedSemaphore(8),
+}
+_NO_BULKHEAD = contextlib.nullcontext()
+
+
+def backoff_seconds(attempt: int) -> float:
+    # Full jitter keeps concurrent callers that hit the same 429/503 from retrying in lockstep.
+    return random.uniform(0.0, min(8.0, 0.5 * (2**attempt)))
+
+
+def retry_after_seconds(response: httpx.Response) -> float:
+    # Only the delta-seconds form is honored; HTTP-date values fall back to backoff.
+    try:
+        retry_after = float(response.headers.get("retry-after", 0))
+    except ValueError:
+        return 0.0
+    if not retry_after > 0.0:  # also rejects NaN
+        return 0.0
+    return min(retry_after, RETRY_AFTER_MAX_SECONDS)
+
+
+def get_shared_client() -> httpx.Client:
+    """Return the process-wide pooled client used for Census API requests.
+
+    Reusing one client keeps TCP/TLS connections to the geocoder and Census
+    Reporter alive across requests instead of handshaking on every call.
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        with _SHARED_CLIENT_LOCK:
+            if _SHARED_CLIENT is None:
+                # The pool is shared by the geocoder and Census Reporter hosts, so keep
+                # enough idle connections for both and hold them between requests.
+                transport = httpx.HTTPTransport(
+                    http2=_HTTP2_AVAILABLE,
+                    retries=0,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=16,
+                        max_connections=64,
+                        keepalive_expiry=30.0,
+                    ),
+                )
+                _SHARED_CLIENT = httpx.Client(
+                    transport=transport,
+                    follow_redirects=True,
+                    headers={"User-Agent": USER_AGENT},
+                )
+                atexit.register(_SHARED_CLIENT.close)
+    return _SHARED_CLIENT
+
+
+def short_error_text(text: str, limit: int = 240) -> str:
+    one_line = " ".join(text.split())
+    if len(one_line) <= limit:
+        return one_line
+    return one_line[:limit] + "..."
+
+
+def is_error_status(status: int) -> bool:
+    return status in RETRYABLE_STATUS_CODES or 400 <= status < 500
+
+
+def send_streaming(client: httpx.Client, request: httpx.Request) -> httpx.Response:
+    """Send ``request``, reading the body only when the status is not an error.
+
+    Error responses are returned unread so callers can take a bounded preview with
+    ``error_body_preview`` instead of downloading the whole body.
+    """
+    response = client.send(request, stream=True)
+    if is_error_status(response.status_code):
+        return response
+    try:
+        response.read()
+    except BaseException:
+        response.close()
+        raise
+    return response
+
+
+def read_error_body(response: httpx.Response) -> str:
+    """Read at most ERROR_BODY_PREVIEW_BYTES of an error body, then close the response."""
+    preview = bytearray()
+    try:
+        for chunk in response.iter_bytes():
+            preview += chunk
+            if len(preview) >= ERROR_BODY_PREVIEW_BYTES:
+                break
+    except httpx.TransportError:
+        pass  # The status code already reports the failure; a partial body will do.
+    finally:
+        response.close()
+    return bytes(preview[:ERROR_BODY_PREVIEW_BYTES]).decode(
+        response.charset_encoding or "utf-8", errors="replace"
+    )
+
+
+def error_body_preview(response: httpx.Response) -> str:
+    return short_error_text(read_error_body(response))
+
+
+def send_with_retries(
+    client: httpx.Client, request: httpx.Request, retries: int
+) -> httpx.Response:
+    """Send ``request``, re-sending it on transient network errors or retryable statuses.
+
+    Retrying here rather than in a transport means ``ApiConfig.retries`` applies to
+    whatever client the caller passes in. Waits use full-jitter backoff, stretched
+    to a retryable response's Retry-After. The host's bulkhead slot is held only
+    while an attempt is in flight, so requests sleeping between retries don't
+    starve other callers. The last response is returned as-is (unread if it is an
+    error), and the last network error propagates.
+    """
+    slot = bulkhead(request.url.host)
+    attempt = 0
+    while True:
+        delay = backoff_seconds(attempt)
+        try:
+            with slot:
+                response = send_streaming(client, request)
+        except httpx.TransportError:
+            if attempt >= retries:
+                raise
+        else:
+            if attempt >= retries or response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+            delay = max(retry_after_seconds(response), delay)
+            response.close()
+        time.sleep(delay)
+        attempt += 1
+
+
+def _breaker_open_failures(host: str) -> int:
+    """Return the failure count if the host's breaker is open, else 0.
+
+    Once the cooldown has passed, the first caller is let through as the half-open
+    probe and the cooldown is re-armed, so other callers keep failing fast until
+    the probe succeeds (clearing the breaker) or fails (re-opening it).
+    """
+    with _BREAKER_LOCK:
+        state = _BREAKER_STATE.get(host)
+        if state is None:
+            return 0
+        failures, opened_at = state
+        if failures < _BREAKER_FAILURE_THRESHOLD:
+            return 0
+        now = time.monotonic()
+        if now - opened_at < _BREAKER_COOLDOWN:
+            return failures
+        _BREAKER_STATE[host] = (failures, now)
+        return 0
+
+
+def circuit_open_message(host: str) -> str | None:
+    """Return the fail-fast error message if the host's breaker is open, else None."""
+    failures = _breaker_open_failures(host)
+    if not failures:
+        return None
+    return f"Circuit open for {host} after {failures} upstream failures; skipping request"
+
+
+def record_upstream_failure(host: str) -> None:
+    now = time.monotonic()
+    with _BREAKER_LOCK:
+        failures, since = _BREAKER_STATE.get(host, (0, now))
+        if failures < _BREAKER_FAILURE_THRESHOLD and now - since > _BREAKER_WINDOW:
+            failures, since = 0, now
+        failures += 1
+        if failures >= _BREAKER_FAILURE_THRESHOLD:
+            # (Re)open from this failure; a failed probe after the cooldown re-opens it.
+            since = now
+        _BREAKER_STATE[host] = (failures, since)
+
+
+def record_upstream_success(host: str) -> None:
+    if host in _BREAKER_STATE:
+        with _BREAKER_LOCK:
+            _BREAKER_STATE.pop(host, None)
+
+
+def bulkhead(host: str) -> contextlib.AbstractContextManager[Any]:
+    return _BULKHEADS.get(host, _NO_BULKHEAD)
+
+
+__all__ = [
+    "CENSUS_GEOCODER_COORDINATES_URL",
+    "CENSUS_REPORTER_BASE_URL",
+    "ERROR_BODY_PREVIEW_BYTES",
+    "RETRYABLE_STATUS_CODES",
+    "RETRY_AFTER_MAX_SECONDS",
+    "USER_AGENT",
+    "backoff_seconds",
+    "bulkhead",
+    "circuit_open_message",
+    "error_body_preview",
+    "get_shared_client",
+    "is_error_status",
+    "json_loads",
+    "read_error_body",
+    "record_upstream_failure",
+    "record_upstream_success",
+    "retry_after_seconds",
+    "send_streaming",
+    "send_with_retries",
+    "short_error_text",
+]
@@ -6,17 +6,19 @@ Also exposes chat_router for mounting in backend.app.main.
 
 from typing import Any
 
-from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi import APIRouter, BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, ConfigDict, Field
 
 try:
     from .config import GOOGLE_CLOUD_TTS_API_KEY
-    from .chat import chat
+    from .chat import chat_async
+    from .keywords import write_keywords_to_file
     from .tts import synthesize_tts
 except ImportError:
     from config import GOOGLE_CLOUD_TTS_API_KEY
-    from chat import chat
+    from chat import chat_async
+    from keywords import write_keywords_to_file
     from tts import synthesize_tts
 
 chat_router = APIRouter(prefix="", tags=["chat"])
@@ -65,7 +67,7 @@ class TTSRequestBody(BaseModel):
 # --- Routes ---
 
 @chat_router.post("/api/chat", response_model=ChatResponseBody)
-def post_chat(body: ChatRequestBody) -> dict[str, Any]:
+async def post_chat(body: ChatRequestBody, background_tasks: BackgroundTasks) -> dict[str, Any]:
     """Chat with the location assistant (Gemini)."""
     try:
         keypoints_list = None
@@ -79,7 +81,7 @@ def post_chat(body: ChatRequestBody) -> dict[str, Any]:
                 }
                 for k in body.selectedKeypointsData
             ]
-        result = chat(
+        result = await chat_async(
             message=body.message,
             conversation_history=[{"role": m.role, "content": m.content} for m in body.conversationHistory],
             focus=body.focus,
@@ -89,6 +91,9 @@ def post_chat(body: ChatRequestBody) -> dict[str, Any]:
             selected_keypoints_data=keypoints_list,
             keypoints_radius_m=body.keypointsRadiusM,
         )
+        if result.get("mapKeywords"):
+            # Written after the response is sent so disk I/O doesn't delay the reply.
+            background_tasks.add_task(write_keywords_to_file, result["mapKeywords"], {"source": body.message})
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
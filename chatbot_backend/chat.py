@@ -3,8 +3,16 @@ Chat API logic: Gemini conversation, ranking, weights/keywords parsing.
 """
 
 import re
+from functools import lru_cache
 from typing import Any
 
+try:
+    from google.genai import Client
+    from google.genai.types import Content, GenerateContentConfig, Part
+except ImportError:  # reported per request so the rest of the app still starts
+    Client = None
+    Content = GenerateContentConfig = Part = None
+
 try:
     from .config import GOOGLE_GENERATIVE_AI_API_KEY, GEMINI_CHAT_MODEL, SUPPORTS_REASONING_UI
     from .chat_config import (
@@ -32,6 +40,20 @@ except ImportError:
 
 MAX_HISTORY_TURNS = 10
 
+# Phrasings that ask for a ranking, e.g. "rank them", "what's the best", "order these".
+_RANK_RE = re.compile(
+    r"rank\s*(?:them|these|my|the)"
+    r"|what'?s\s+the\s+best"
+    r"|which\s+(?:one\s+)?(?:best|first)"
+    r"|order\s+(?:them|these)"
+)
+
+
+@lru_cache(maxsize=4)
+def _genai_client(api_key: str):
+    """Reuse one Gemini client (and its HTTP connection pool) per API key."""
+    return Client(api_key=api_key)
+
 
 def _parse_reasoning_from_reply(reply: str) -> tuple[str, str | None]:
     """
@@ -52,35 +74,23 @@ def _parse_reasoning_from_reply(reply: str) -> tuple[str, str | None]:
 
 
 def _is_rank_request(message: str) -> bool:
-    lower = message.lower().strip()
-    if re.search(r"rank\s*(them|these|my|the)", lower):
-        return True
-    if re.search(r"what'?s\s+the\s+best", lower):
-        return True
-    if re.search(r"which\s+(one\s+)?(best|first)", lower):
-        return True
-    if re.search(r"order\s+(them|these)", lower):
-        return True
-    return False
+    return _RANK_RE.search(message.lower()) is not None
 
 
-def chat(
+def _prepare_turn(
     message: str,
     conversation_history: list[dict[str, str]],
     focus: str,
-    weights: Weights | None = None,
-    use_defaults: bool = True,
-    locations_with_metrics: list[dict] | None = None,
-    selected_keypoints_data: list[dict] | None = None,
-    keypoints_radius_m: int | None = None,
-    api_key: str | None = None,
-) -> dict[str, Any]:
+    weights: Weights | None,
+    use_defaults: bool,
+    locations_with_metrics: list[dict] | None,
+    selected_keypoints_data: list[dict] | None,
+    keypoints_radius_m: int | None,
+    api_key: str | None,
+) -> tuple[Any, Any, list[Any], str, str | None, list[str] | None]:
     """
-    Process one chat turn. Returns dict with:
-      reply: str
-      weights?: Weights
-      rankedIds?: list[str]
-      mapKeywords?: list[str]
+    Validate one chat turn and build everything the Gemini call needs.
+    Returns (client, config, history_for_api, prompt, fallback_reply, ranked_ids).
     """
     key = api_key or GOOGLE_GENERATIVE_AI_API_KEY
     if not key:
@@ -93,14 +103,15 @@ def chat(
 
     focus_typed: Focus = focus
     if use_defaults or not weights or len(weights) == 0:
-        weights = DEFAULT_WEIGHTS[focus_typed].copy()
+        # Only read from here on (ranking and the prompt), so the shared default is not copied.
+        weights = DEFAULT_WEIGHTS[focus_typed]
     else:
         weights = dict(weights)
 
-    from google.genai import Client
-    from google.genai.types import GenerateContentConfig, Content, Part
+    if Client is None:
+        raise RuntimeError("google-genai is not installed")
 
-    client = Client(api_key=key)
+    client = _genai_client(key)
     config = GenerateContentConfig(
         system_instruction=build_system_instruction(
             focus_typed,
@@ -121,21 +132,12 @@ def chat(
             Content(role=role, parts=[Part.from_text(text=msg.get("content", ""))])
         )
 
-    chat_session = client.chats.create(
-        model=GEMINI_CHAT_MODEL,
-        config=config,
-        history=history_for_api,
-    )
-
-    ranked_ids: list[str] | None = None
-
     if (
         locations_with_metrics
         and len(locations_with_metrics) >= 2
         and _is_rank_request(message)
     ):
-        metric_ids = list(METRIC_IDS)
-        ranked = rank_locations(locations_with_metrics, weights, metric_ids)
+        ranked = rank_locations(locations_with_metrics, weights, METRIC_IDS)
         ranked_ids = [loc.get("id", "") for loc in ranked]
         rank_summary = ", ".join(
             f"#{i+1}: {loc.get('label') or loc.get('id', '')}" for i, loc in enumerate(ranked)
@@ -145,15 +147,23 @@ def chat(
             f"In 2-3 sentences, explain why the first location ranks best given their priorities "
             f"(weights: {weights}). Use only the metric values from the context."
         )
-        response = chat_session.send_message(prompt_why)
-        reply = (response.text or f"Ranked order: {rank_summary}.").strip()
-    else:
-        response = chat_session.send_message(message)
-        reply = (response.text or "").strip()
+        return client, config, history_for_api, prompt_why, f"Ranked order: {rank_summary}.", ranked_ids
+
+    return client, config, history_for_api, message, None, None
+
+
+def _finish_turn(
+    message: str,
+    response_text: str | None,
+    fallback_reply: str | None,
+    ranked_ids: list[str] | None,
+    persist_keywords: bool = True,
+) -> dict[str, Any]:
+    reply = (response_text or fallback_reply or "").strip()
 
     parsed_weights = parse_weights_from_reply(reply)
     map_keywords = parse_map_keywords_from_reply(reply)
-    if map_keywords:
+    if map_keywords and persist_keywords:
         write_keywords_to_file(map_keywords, {"source": message})
 
     if SUPPORTS_REASONING_UI:
@@ -177,3 +187,78 @@ def chat(
     if map_keywords:
         result["mapKeywords"] = map_keywords
     return result
+
+
+def chat(
+    message: str,
+    conversation_history: list[dict[str, str]],
+    focus: str,
+    weights: Weights | None = None,
+    use_defaults: bool = True,
+    locations_with_metrics: list[dict] | None = None,
+    selected_keypoints_data: list[dict] | None = None,
+    keypoints_radius_m: int | None = None,
+    api_key: str | None = None,
+) -> dict[str, Any]:
+    """
+    Process one chat turn. Returns dict with:
+      reply: str
+      weights?: Weights
+      rankedIds?: list[str]
+      mapKeywords?: list[str]
+    """
+    client, config, history_for_api, prompt, fallback_reply, ranked_ids = _prepare_turn(
+        message,
+        conversation_history,
+        focus,
+        weights,
+        use_defaults,
+        locations_with_metrics,
+        selected_keypoints_data,
+        keypoints_radius_m,
+        api_key,
+    )
+    chat_session = client.chats.create(
+        model=GEMINI_CHAT_MODEL,
+        config=config,
+        history=history_for_api,
+    )
+    response = chat_session.send_message(prompt)
+    return _finish_turn(message, response.text, fallback_reply, ranked_ids)
+
+
+async def chat_async(
+    message: str,
+    conversation_history: list[dict[str, str]],
+    focus: str,
+    weights: Weights | None = None,
+    use_defaults: bool = True,
+    locations_with_metrics: list[dict] | None = None,
+    selected_keypoints_data: list[dict] | None = None,
+    keypoints_radius_m: int | None = None,
+    api_key: str | None = None,
+) -> dict[str, Any]:
+    """
+    Same as chat(), but awaits Gemini through the SDK's async client so the event
+    loop is free while the model generates instead of holding a worker thread.
+    mapKeywords are returned but not written to keywords_llm/; the caller persists
+    them (the /api/chat endpoint does so in a background task).
+    """
+    client, config, history_for_api, prompt, fallback_reply, ranked_ids = _prepare_turn(
+        message,
+        conversation_history,
+        focus,
+        weights,
+        use_defaults,
+        locations_with_metrics,
+        selected_keypoints_data,
+        keypoints_radius_m,
+        api_key,
+    )
+    chat_session = client.aio.chats.create(
+        model=GEMINI_CHAT_MODEL,
+        config=config,
+        history=history_for_api,
+    )
+    response = await chat_session.send_message(prompt)
+    return _finish_turn(message, response.text, fallback_reply, ranked_ids, persist_keywords=False)
@@ -3,9 +3,10 @@ Chat config: default weights and system prompt for the location-assistant bot.
 See design.md for metrics list and grounding.
 """
 
+from functools import lru_cache
 from typing import Literal, TypedDict
 
-METRIC_IDS = [
+METRIC_IDS = (
     "population",
     "population_density",
     "income",
@@ -13,7 +14,7 @@ METRIC_IDS = [
     "parking",
     "land_cost",
     "disaster_risk",
-]
+)
 
 Focus = Literal["tenant", "small_business"]
 Weights = dict[str, float]
@@ -77,14 +78,10 @@ class LocationWithMetrics(TypedDict, total=False):
     disaster_risk: float
 
 
-def build_system_instruction(
-    focus: Focus,
-    locations_with_metrics: list[dict] | None = None,
-    use_reasoning: bool = False,
-    selected_keypoints_data: list[dict] | None = None,
-    keypoints_radius_m: int | None = None,
-) -> str:
-    """Build the full system instruction for Gemini."""
+@lru_cache(maxsize=None)
+def _static_instruction(focus: Focus, use_reasoning: bool) -> str:
+    """Leading part of the system instruction, identical for every request with the
+    same focus, so the provider can reuse its cached prompt prefix."""
     weights = DEFAULT_WEIGHTS[focus]
     focus_label = "Tenant" if focus == "tenant" else "Small Business"
     out = f"""{SYSTEM_PROMPT_BASE}
@@ -93,18 +90,33 @@ Current focus: {focus_label}.
 Default weights for this focus: {weights}."""
     if use_reasoning:
         out += REASONING_PROMPT_ADDON
+    return out
+
+
+def build_system_instruction(
+    focus: Focus,
+    locations_with_metrics: list[dict] | None = None,
+    use_reasoning: bool = False,
+    selected_keypoints_data: list[dict] | None = None,
+    keypoints_radius_m: int | None = None,
+) -> str:
+    """Build the full system instruction for Gemini.
+
+    Per-request context (locations, key points) is appended after the static part.
+    """
+    parts = [_static_instruction(focus, use_reasoning)]
 
     if locations_with_metrics and len(locations_with_metrics) > 0:
-        out += "\n\nLocations with metrics (use only these values for compare/rank):\n"
+        parts.append("\n\nLocations with metrics (use only these values for compare/rank):\n")
         for i, loc in enumerate(locations_with_metrics):
             loc_copy = dict(loc)
             id_ = loc_copy.pop("id", "")
             label = loc_copy.pop("label", None)
             name = label or f"Location {i + 1}"
-            out += f"- {name} (id: {id_}): {loc_copy}\n"
+            parts.append(f"- {name} (id: {id_}): {loc_copy}\n")
         if len(locations_with_metrics) == 1:
             single_name = locations_with_metrics[0].get("label") or locations_with_metrics[0].get("id") or "this location"
-            out += (
+            parts.append(
                 f"\nThe user has currently selected this location on the map ({single_name}). "
                 "When they ask where they are interested in living, which city they selected, "
                 "what location they are viewing, or similar, tell them this location and use the metrics above to describe it.\n"
@@ -112,20 +124,20 @@ Default weights for this focus: {weights}."""
 
     if selected_keypoints_data and len(selected_keypoints_data) > 0:
         radius_str = f" within {keypoints_radius_m}m" if keypoints_radius_m else ""
-        out += f"\n\nSelected Key Points (amenities nearby{radius_str}):\n"
+        parts.append(f"\n\nSelected Key Points (amenities nearby{radius_str}):\n")
         for kp in selected_keypoints_data:
             label = kp.get("label") or kp.get("id") or "?"
             count = kp.get("count", 0)
             names = kp.get("names")
             if names and isinstance(names, list) and len(names) > 0:
                 names_str = ", ".join(str(n) for n in names[:10] if n)
-                out += f"- {label}: {count} (examples: {names_str})\n"
+                parts.append(f"- {label}: {count} (examples: {names_str})\n")
             else:
-                out += f"- {label}: {count}\n"
-        out += (
+                parts.append(f"- {label}: {count}\n")
+        parts.append(
             "When the user asks about nearby amenities, parks, transit, retail, etc., "
             "use these counts and example names when available. Only refer to key points the user has selected (checked). "
             "When asked for specific place names, list the examples provided.\n"
         )
 
-    return out
+    return "".join(parts)
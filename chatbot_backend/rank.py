@@ -3,13 +3,15 @@ Rank locations by weighted score. Lower-is-better metrics use 1 - normalized.
 design.md: "for lower is better (land_cost, disaster_risk), use 1 - normalized"
 """
 
+from collections.abc import Sequence
+
 LOWER_IS_BETTER = frozenset({"land_cost", "disaster_risk"})
 
 
 def rank_locations(
     locations: list[dict],
     weights: dict[str, float],
-    metric_ids: list[str],
+    metric_ids: Sequence[str],
 ) -> list[dict]:
     """
     Rank locations by weighted normalized score.
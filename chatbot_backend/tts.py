@@ -12,6 +12,11 @@ import urllib.error
 import urllib.request
 from typing import Any
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional speedup; stdlib json parses the same payloads.
+    from json import loads as _json_loads
+
 VOICE_NAME = "en-US-Chirp3-HD-Enceladus"
 VOICE_LANGUAGE = "en-US"
 SPEAKING_RATE = 1.0
@@ -70,7 +75,8 @@ def synthesize_tts(api_key: str, text: str) -> dict[str, Any]:
 
     try:
         with urllib.request.urlopen(req, timeout=30) as resp:
-            result = json.loads(resp.read().decode())
+            # The reply carries the whole clip as base64, so parse the bytes directly.
+            result = _json_loads(resp.read())
     except urllib.error.HTTPError as e:
         err_body = e.read().decode() if e.fp else ""
         try:
@@ -6,8 +6,6 @@ import json
 import sys
 from pathlib import Path
 
-import httpx
-
 from backend.app.census_profile_service import (
     CENSUS_GEOCODER_COORDINATES_URL,
     CENSUS_REPORTER_BASE_URL,
@@ -23,6 +21,7 @@ from backend.app.census_profile_service import (
     extract_first_tract,
     extract_optional_first_geography,
     extract_optional_zcta,
+    get_shared_client,
     lookup_census_profile_by_point,
     request_json,
 )
@@ -190,17 +189,16 @@ def print_summary(result: dict[str, object], output_path: Path) -> None:
 def lookup_census(args: argparse.Namespace) -> dict[str, object]:
     output_path = args.out or default_output_path(args.lat, args.lon)
 
-    with httpx.Client(follow_redirects=True) as client:
-        result = lookup_census_profile_by_point(
-            client,
-            lat=args.lat,
-            lon=args.lon,
-            acs=args.acs,
-            include_parents=not args.no_parents,
-            timeout=args.timeout,
-            retries=args.retries,
-            requester=request_json,
-        )
+    result = lookup_census_profile_by_point(
+        get_shared_client(),
+        lat=args.lat,
+        lon=args.lon,
+        acs=args.acs,
+        include_parents=not args.no_parents,
+        timeout=args.timeout,
+        retries=args.retries,
+        requester=request_json,
+    )
 
     # Script-only metadata remains local to CLI output.
     input_block = result.get("input")
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clear_census_caches():
+    """Keep module-level upstream caches from leaking mocked payloads across tests."""
+    import backend.app.census_profile_service as cps
+    import backend.app.census_service as cs
+    import backend.app.upstream as upstream
+
+    cps._GEOCODER_CACHE.clear()
+    cps._PROFILE_CACHE.clear()
+    upstream._BREAKER_STATE.clear()
+    cs._DATA_SHOW_CACHE.clear()
+    cs._UNSUPPORTED_LEVELS.clear()
+    cs._TRACT_GEO_CACHE.clear()
+    yield
+    cps._GEOCODER_CACHE.clear()
+    cps._PROFILE_CACHE.clear()
+    upstream._BREAKER_STATE.clear()
+    cs._DATA_SHOW_CACHE.clear()
+    cs._UNSUPPORTED_LEVELS.clear()
+    cs._TRACT_GEO_CACHE.clear()
@@ -269,3 +269,96 @@ def test_by_point_404_when_no_tract(monkeypatch):
 
     resp = client.get("/api/census/by-point", params={"lat": 43.074, "lon": -89.384})
     assert resp.status_code == 404
+
+
+def test_by_point_returns_502_on_upstream_error(monkeypatch):
+    import backend.app.census_profile_service as cps
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        raise cps.UpstreamAPIError(stage, "HTTP 503: unavailable")
+
+    monkeypatch.setattr(cps, "request_json", fake_request_json)
+
+    import backend.app.main as main_module
+
+    importlib.reload(main_module)
+    client = TestClient(main_module.app)
+
+    resp = client.get("/api/census/by-point", params={"lat": 43.074, "lon": -89.384})
+    assert resp.status_code == 502
+
+
+def test_by_point_stream_sends_geocoder_line_then_profile(monkeypatch):
+    import json
+
+    import backend.app.census_profile_service as cps
+
+    stages: list[str] = []
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        stages.append(stage)
+        if stage == "geocoder":
+            return _geocoder_payload()
+        if stage == "tract_full":
+            return _tables_payload([TRACT_GEOID])
+        if stage == "comparisons":
+            return _tables_payload([TRACT_GEOID])
+        raise AssertionError(f"Unexpected stage: {stage}")
+
+    monkeypatch.setattr(cps, "request_json", fake_request_json)
+
+    import backend.app.main as main_module
+
+    importlib.reload(main_module)
+    client = TestClient(main_module.app)
+
+    resp = client.get(
+        "/api/census/by-point/stream",
+        params={"lat": 43.074, "lon": -89.384, "include_parents": "false"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [line["stage"] for line in lines] == ["geocoder", "profile"]
+    assert lines[0]["data"]["reporter_geoid"] == TRACT_GEOID
+    assert lines[1]["data"]["tract"]["reporter_geoid"] == TRACT_GEOID
+    assert stages.count("geocoder") == 1
+
+
+def test_by_point_stream_404_when_no_tract(monkeypatch):
+    import backend.app.census_profile_service as cps
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        if stage == "geocoder":
+            return {"result": {"geographies": {"Census Tracts": []}}}
+        raise AssertionError(f"Unexpected stage: {stage}")
+
+    monkeypatch.setattr(cps, "request_json", fake_request_json)
+
+    import backend.app.main as main_module
+
+    importlib.reload(main_module)
+    client = TestClient(main_module.app)
+
+    resp = client.get("/api/census/by-point/stream", params={"lat": 43.074, "lon": -89.384})
+    assert resp.status_code == 404
+
+
+def test_by_point_stream_502_before_streaming_on_malformed_tract_geoid(monkeypatch):
+    import backend.app.census_profile_service as cps
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        if stage == "geocoder":
+            return {"result": {"geographies": {"Census Tracts": [{"GEOID": "5502500"}]}}}
+        raise AssertionError(f"Unexpected stage: {stage}")
+
+    monkeypatch.setattr(cps, "request_json", fake_request_json)
+
+    import backend.app.main as main_module
+
+    importlib.reload(main_module)
+    client = TestClient(main_module.app)
+
+    resp = client.get("/api/census/by-point/stream", params={"lat": 43.074, "lon": -89.384})
+    assert resp.status_code == 502
+    assert "Unexpected tract GEOID format" in resp.json()["detail"]
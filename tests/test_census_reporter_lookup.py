@@ -368,3 +368,197 @@ def test_invalid_latitude_rejected() -> None:
     with pytest.raises(SystemExit) as exc_info:
         cr.main(["--lat", "120", "--lon", "-89.384"])
     assert exc_info.value.code == 2
+
+
+def test_per_table_fallback_keeps_table_order_for_errors() -> None:
+    from backend.app.census_profile_service import ApiConfig, fetch_data_show_resilient
+
+    failing = {"B19013", "B01002"}
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        if stage == "tract_full":
+            raise cr.UpstreamAPIError(
+                "tract_full", 'HTTP 400: {"error":"None of the releases had the requested geo_ids and table_ids"}'
+            )
+        table_id = stage.split(":", 1)[1]
+        if table_id in failing:
+            raise cr.UpstreamAPIError(stage, "HTTP 400: unsupported")
+        return {
+            "release": {"id": "acs2024_5yr"},
+            "tables": {table_id: {"title": table_id}},
+            "geography": {TRACT_GEOID: {"name": "Census Tract 17.04"}},
+            "data": {TRACT_GEOID: {table_id: {"estimate": {f"{table_id}001": 1}}}},
+        }
+
+    table_ids = ["B01003", "B01002", "B01001", "B19013", "B19301"]
+    payload, errors = fetch_data_show_resilient(
+        None,  # type: ignore[arg-type]
+        acs="latest",
+        table_ids=table_ids,
+        geoids=[TRACT_GEOID],
+        stage="tract_full",
+        config=ApiConfig(acs="latest"),
+        requester=fake_request_json,
+    )
+    assert list(payload["data"][TRACT_GEOID]) == ["B01003", "B01001", "B19301"]
+    assert [error.get("table_id") for error in errors] == [None, "B01002", "B19013"]
+    assert "3/5 tables succeeded" in errors[0]["message"]
+
+
+def test_geocoder_responses_are_cached_by_rounded_point() -> None:
+    from backend.app.census_profile_service import ApiConfig, geocode_point
+
+    calls: list[dict] = []
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        calls.append(params)
+        return _geocoder_payload()
+
+    config = ApiConfig(acs="latest")
+    first = geocode_point(None, lat=43.074012, lon=-89.384012, config=config, requester=fake_request_json)
+    first["result"]["geographies"].clear()
+    second = geocode_point(None, lat=43.074014, lon=-89.384008, config=config, requester=fake_request_json)
+    assert len(calls) == 1
+    assert second["result"]["geographies"]["Census Tracts"][0]["GEOID"] == "55025001704"
+
+    geocode_point(None, lat=43.08, lon=-89.384, config=config, requester=fake_request_json)
+    assert len(calls) == 2
+
+
+def test_geocoder_cache_evicts_the_least_recently_used_point(monkeypatch: pytest.MonkeyPatch) -> None:
+    import backend.app.census_profile_service as cps
+
+    calls: list[float] = []
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        calls.append(params["y"])
+        return _geocoder_payload()
+
+    monkeypatch.setattr(cps, "_GEOCODER_CACHE_MAXSIZE", 2)
+    config = cps.ApiConfig(acs="latest")
+    for lat in (43.1, 43.2, 43.1, 43.3, 43.1):
+        cps.geocode_point(None, lat=lat, lon=-89.384, config=config, requester=fake_request_json)
+    # 43.1 was read again before 43.3 arrived, so 43.2 is the entry that gets evicted.
+    assert calls == [43.1, 43.2, 43.3]
+
+
+def test_request_json_retries_retryable_statuses(monkeypatch: pytest.MonkeyPatch) -> None:
+    import httpx
+
+    import backend.app.census_profile_service as cps
+    import backend.app.upstream as upstream
+
+    monkeypatch.setattr(upstream, "backoff_seconds", lambda attempt: 0)
+    statuses = iter([503, 429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json={"ok": True})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    payload = cps.request_json(
+        client, "https://example.test/", params=None, stage="probe", config=cps.ApiConfig(acs="latest", retries=2)
+    )
+    assert payload == {"ok": True}
+
+    statuses = iter([503, 503])
+    with pytest.raises(cps.UpstreamAPIError, match="HTTP 503"):
+        cps.request_json(
+            client, "https://example.test/", params=None, stage="probe", config=cps.ApiConfig(acs="latest", retries=1)
+        )
+
+
+def test_retries_wait_for_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    import httpx
+
+    import backend.app.census_profile_service as cps
+    import backend.app.upstream as upstream
+
+    sleeps: list[float] = []
+    monkeypatch.setattr(upstream, "backoff_seconds", lambda attempt: 0.25)
+    monkeypatch.setattr(upstream.time, "sleep", sleeps.append)
+    responses = iter(
+        [httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(503), httpx.Response(200, json={})]
+    )
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: next(responses)))
+    cps.request_json(
+        client, "https://example.test/", params=None, stage="probe", config=cps.ApiConfig(acs="latest", retries=2)
+    )
+    assert sleeps == [2.0, 0.25]
+
+
+def test_bulkhead_slot_is_released_between_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    import httpx
+
+    import backend.app.census_profile_service as cps
+    import backend.app.upstream as upstream
+
+    slot = threading.BoundedSemaphore(1)
+    monkeypatch.setitem(upstream._BULKHEADS, "example.test", slot)
+    free_while_sleeping: list[bool] = []
+
+    def fake_sleep(seconds: float) -> None:
+        acquired = slot.acquire(blocking=False)
+        if acquired:
+            slot.release()
+        free_while_sleeping.append(acquired)
+
+    monkeypatch.setattr(upstream.time, "sleep", fake_sleep)
+    statuses = iter([503, 503, 200])
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(next(statuses), json={})))
+    cps.request_json(
+        client, "https://example.test/", params=None, stage="probe", config=cps.ApiConfig(acs="latest", retries=2)
+    )
+    assert free_while_sleeping == [True, True]
+
+
+def test_circuit_breaker_fails_fast_after_repeated_upstream_errors() -> None:
+    import httpx
+
+    import backend.app.census_profile_service as cps
+    import backend.app.upstream as upstream
+
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(503, text="unavailable")
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    config = cps.ApiConfig(acs="latest", retries=0)
+    for _ in range(upstream._BREAKER_FAILURE_THRESHOLD):
+        with pytest.raises(cps.UpstreamAPIError, match="HTTP 503"):
+            cps.request_json(client, "https://example.test/", params=None, stage="probe", config=config)
+
+    with pytest.raises(cps.UpstreamAPIError, match="Circuit open"):
+        cps.request_json(client, "https://example.test/", params=None, stage="probe", config=config)
+    assert calls["n"] == upstream._BREAKER_FAILURE_THRESHOLD
+
+
+def test_profile_is_reused_for_points_in_the_same_tract() -> None:
+    from backend.app.census_profile_service import lookup_census_profile_by_point
+
+    seen_stages: list[str] = []
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        seen_stages.append(stage)
+        if stage == "geocoder":
+            return _geocoder_payload()
+        if stage == "parents":
+            return _parents_payload()
+        if stage == "tract_full":
+            return _tract_full_payload()
+        if stage == "comparisons":
+            return _comparison_payload()
+        raise AssertionError(f"Unexpected stage: {stage}")
+
+    first = lookup_census_profile_by_point(None, lat=43.074, lon=-89.384, requester=fake_request_json)
+    second = lookup_census_profile_by_point(None, lat=43.075, lon=-89.385, requester=fake_request_json)
+
+    assert seen_stages.count("geocoder") == 2
+    assert seen_stages.count("tract_full") == 1
+    assert seen_stages.count("comparisons") == 1
+    assert second["input"]["latitude"] == 43.075
+    assert second["derived"] == first["derived"]
+    assert second["derived"] is not first["derived"]
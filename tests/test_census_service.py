@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import pytest
+
+import backend.app.census_service as cs
+
+
+GEOID = "15000US550250017041"
+NO_RELEASE_ERROR = 'HTTP 400: {"error":"None of the releases had the requested geo_ids and table_ids"}'
+
+
+def test_fallback_bisects_chunks_to_isolate_unsupported_tables(monkeypatch) -> None:
+    unsupported = {"B05006", "B16001"}
+    requested: list[list[str]] = []
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        table_ids = params["table_ids"].split(",")
+        requested.append(table_ids)
+        if unsupported & set(table_ids):
+            raise cs.UpstreamAPIError(stage, NO_RELEASE_ERROR)
+        return {
+            "release": {"id": "acs2022_5yr"},
+            "tables": {table_id: {"title": table_id} for table_id in table_ids},
+            "geography": {GEOID: {"name": "Block Group 1"}},
+            "data": {
+                GEOID: {
+                    table_id: {"estimate": {f"{table_id}001": 1.0}, "error": {f"{table_id}001": 0.0}}
+                    for table_id in table_ids
+                }
+            },
+        }
+
+    monkeypatch.setattr(cs, "request_json", fake_request_json)
+
+    payload, errors = cs.fetch_data_show_resilient(
+        None,
+        acs="latest",
+        table_ids=cs.TABLE_IDS,
+        geoid=GEOID,
+        stage="data_show:census_block_group",
+        config=cs.ApiConfig(acs="latest"),
+    )
+
+    assert list(payload["data"][GEOID]) == [t for t in cs.TABLE_IDS if t not in unsupported]
+    assert [error.get("table_id") for error in errors[1:]] == [t for t in cs.TABLE_IDS if t in unsupported]
+    assert f"({len(cs.TABLE_IDS) - 2}/{len(cs.TABLE_IDS)} tables succeeded)" in errors[0]["message"]
+    # One bulk request plus bisected chunks, well under one request per table.
+    assert len(requested) < len(cs.TABLE_IDS)
+
+
+def test_data_show_results_are_cached_per_geoid(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        calls.append(params["geo_ids"])
+        return {"release": None, "tables": {}, "geography": {}, "data": {params["geo_ids"]: {}}}
+
+    monkeypatch.setattr(cs, "request_json", fake_request_json)
+    config = cs.ApiConfig(acs="latest")
+
+    first, _ = cs.fetch_data_show_resilient(
+        None, acs="latest", table_ids=cs.TABLE_IDS, geoid=GEOID, stage="data_show", config=config
+    )
+    first["data"].clear()
+    second, _ = cs.fetch_data_show_resilient(
+        None, acs="latest", table_ids=cs.TABLE_IDS, geoid=GEOID, stage="data_show", config=config
+    )
+
+    assert calls == [GEOID]
+    assert GEOID in second["data"]
+
+
+def test_fallback_results_with_transient_table_errors_are_not_cached(monkeypatch) -> None:
+    calls = {"n": 0}
+    upstream_down = {"B19013": True}
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        calls["n"] += 1
+        table_ids = params["table_ids"].split(",")
+        if upstream_down["B19013"] and "B19013" in table_ids:
+            if len(table_ids) == len(cs.TABLE_IDS):
+                raise cs.UpstreamAPIError(stage, NO_RELEASE_ERROR)
+            raise cs.UpstreamAPIError(stage, "HTTP 503: Service Unavailable")
+        return {
+            "release": {"id": "acs2022_5yr"},
+            "tables": {},
+            "geography": {},
+            "data": {GEOID: {table_id: {"estimate": {f"{table_id}001": 1.0}} for table_id in table_ids}},
+        }
+
+    monkeypatch.setattr(cs, "request_json", fake_request_json)
+    config = cs.ApiConfig(acs="latest")
+
+    _, errors = cs.fetch_data_show_resilient(
+        None, acs="latest", table_ids=cs.TABLE_IDS, geoid=GEOID, stage="data_show", config=config
+    )
+    assert [error.get("table_id") for error in errors[1:]] == ["B19013"]
+
+    upstream_down["B19013"] = False
+    calls["n"] = 0
+    payload, errors = cs.fetch_data_show_resilient(
+        None, acs="latest", table_ids=cs.TABLE_IDS, geoid=GEOID, stage="data_show", config=config
+    )
+    assert calls["n"] == 1
+    assert errors == []
+    assert "B19013" in payload["data"][GEOID]
+
+
+def test_retry_after_header_is_honored_and_capped() -> None:
+    import httpx
+
+    def response(value: str) -> httpx.Response:
+        return httpx.Response(503, headers={"Retry-After": value})
+
+    from backend.app.upstream import RETRY_AFTER_MAX_SECONDS, retry_after_seconds
+
+    assert retry_after_seconds(response("2")) == 2.0
+    assert retry_after_seconds(response("3600")) == RETRY_AFTER_MAX_SECONDS
+    assert retry_after_seconds(response("Wed, 21 Oct 2015 07:28:00 GMT")) == 0.0
+    assert retry_after_seconds(httpx.Response(503)) == 0.0
+
+
+def test_levels_without_tables_are_skipped_on_later_lookups(monkeypatch) -> None:
+    requested_geoids: list[str] = []
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        if stage == "geocoder":
+            block = f"55025001704{int(params['y'] * 1000) % 10000:04d}"
+            return {
+                "result": {
+                    "geographies": {
+                        "2020 Census Blocks": [{"GEOID": block}],
+                        "Census Tracts": [{"GEOID": "55025001704"}],
+                    }
+                }
+            }
+        geoid = params["geo_ids"]
+        requested_geoids.append(geoid)
+        if geoid.startswith("10000US"):
+            raise cs.UpstreamAPIError(stage, NO_RELEASE_ERROR)
+        table_ids = params["table_ids"].split(",")
+        return {
+            "release": {"id": "acs2022_5yr"},
+            "tables": {},
+            "geography": {},
+            "data": {geoid: {table_id: {"estimate": {f"{table_id}001": 1.0}} for table_id in table_ids}},
+        }
+
+    monkeypatch.setattr(cs, "request_json", fake_request_json)
+
+    first = cs.lookup_smallest_census_by_point(None, lat=43.074, lon=-89.384, acs="latest")
+    assert first["selected_for_acs_data"]["attempts"][0]["status"] == "unsupported_level"
+
+    requested_geoids.clear()
+    second = cs.lookup_smallest_census_by_point(None, lat=43.075, lon=-89.384, acs="latest")
+    assert second["selected_for_acs_data"]["attempts"][0]["status"] == "skipped_known_unsupported"
+    assert second["selected_for_acs_data"]["selected_level"] == "census_tract"
+    assert not any(geoid.startswith("10000US") for geoid in requested_geoids)
+
+
+def test_missing_tract_release_is_not_remembered_for_other_tracts(monkeypatch) -> None:
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        if stage == "geocoder":
+            tract = "55025001704" if params["y"] < 43.08 else "55025001705"
+            return {"result": {"geographies": {"Census Tracts": [{"GEOID": tract}]}}}
+        geoid = params["geo_ids"]
+        if geoid == "14000US55025001704":
+            raise cs.UpstreamAPIError(stage, NO_RELEASE_ERROR)
+        table_ids = params["table_ids"].split(",")
+        return {
+            "release": {"id": "acs2022_5yr"},
+            "tables": {},
+            "geography": {},
+            "data": {geoid: {table_id: {"estimate": {f"{table_id}001": 1.0}} for table_id in table_ids}},
+        }
+
+    monkeypatch.setattr(cs, "request_json", fake_request_json)
+
+    with pytest.raises(cs.NoGeographyFoundError):
+        cs.lookup_smallest_census_by_point(None, lat=43.074, lon=-89.384, acs="latest")
+    assert cs._known_unsupported_levels("latest") == set()
+
+    other = cs.lookup_smallest_census_by_point(None, lat=43.090, lon=-89.384, acs="latest")
+    assert other["selected_for_acs_data"]["selected_level"] == "census_tract"
+
+
+def test_points_a_few_meters_apart_are_geocoded_separately(monkeypatch) -> None:
+    geocoded: list[float] = []
+
+    def fake_request_json(client, url, *, params, stage, config):  # type: ignore[no-untyped-def]
+        geocoded.append(params["y"])
+        tract = "55025001704" if params["y"] < 43.07402 else "55025001800"
+        return {"result": {"geographies": {"Census Tracts": [{"GEOID": tract}]}}}
+
+    monkeypatch.setattr(cs, "request_json", fake_request_json)
+    config = cs.ApiConfig(acs="latest")
+
+    # ~3 m apart: one 4-decimal (~11 m) cell but two 5-decimal keys, so a boundary
+    # between them is seen. Points within a single 5-decimal cell would still share.
+    first = cs.geocode_tract(None, lat=43.07401, lon=-89.384, config=config)
+    second = cs.geocode_tract(None, lat=43.07404, lon=-89.384, config=config)
+
+    assert geocoded == [43.07401, 43.07404]
+    assert [first["GEOID"], second["GEOID"]] == ["55025001704", "55025001800"]
+
+
+def test_error_bodies_are_only_previewed(monkeypatch) -> None:
+    import httpx
+
+    chunks_read = {"n": 0}
+
+    class LargeErrorPage(httpx.SyncByteStream):
+        def __iter__(self):
+            for _ in range(1024):
+                chunks_read["n"] += 1
+                yield b"<html>" + b"x" * 1018
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(502, stream=LargeErrorPage())
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    with pytest.raises(cs.UpstreamAPIError, match="HTTP 502: <html>"):
+        cs.request_json(
+            client, "https://example.test/", params=None, stage="probe", config=cs.ApiConfig(acs="latest", retries=0)
+        )
+    assert chunks_read["n"] <= 5
+
+
+def test_structured_no_release_error_is_typed() -> None:
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            400, json={"error": "None of the releases had the requested geo_ids and table_ids"}
+        )
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    with pytest.raises(cs.NoReleasesForGeoError, match="HTTP 400"):
+        cs.request_json(
+            client, "https://example.test/", params=None, stage="probe", config=cs.ApiConfig(acs="latest")
+        )
+    assert not cs._structured_no_release_error('{"error": "Unknown table"}')
+    assert not cs._structured_no_release_error("<html>Bad Request</html>")
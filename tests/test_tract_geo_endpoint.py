@@ -121,3 +121,30 @@ def test_tract_geo_404_when_no_tract(monkeypatch):
     c = TestClient(main_module.app)
     resp = c.get("/api/census/tract-geo", params={"lat": 0.0, "lon": 0.0})
     assert resp.status_code == 404
+
+
+def test_tract_geo_repeat_lookup_is_served_from_cache(monkeypatch):
+    import backend.app.census_service as cs
+
+    seen_stages: list[str] = []
+
+    def _mock_request_json(http_client, url, *, params, stage, config):
+        seen_stages.append(stage)
+        if "geocoding.geo.census.gov" in url:
+            return _GEOCODER_PAYLOAD
+        if "tiger2022" in url:
+            return _TIGER_GEOJSON
+        raise AssertionError(f"Unexpected URL in mock: {url}")
+
+    monkeypatch.setattr(cs, "request_json", _mock_request_json)
+
+    import importlib
+    import backend.app.main as main_module
+
+    importlib.reload(main_module)
+
+    c = TestClient(main_module.app)
+    first = c.get("/api/census/tract-geo", params={"lat": 43.074, "lon": -89.384})
+    second = c.get("/api/census/tract-geo", params={"lat": 43.074, "lon": -89.384})
+    assert first.json() == second.json()
+    assert seen_stages == ["geocoder", "tract_geo"]